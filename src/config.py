@@ -182,6 +182,9 @@ class ServerConfig:
         """Get the resolved database file path."""
         if self.database_url.startswith("sqlite:///"):
             db_path = self.database_url[10:]  # Remove 'sqlite:///'
+            if db_path == ":memory:":
+                # In-memory database; resolving would turn it into a file
+                return Path(db_path)
             return Path(db_path).resolve()
         else:
             raise ValueError(f"Unsupported database URL format: {self.database_url}")
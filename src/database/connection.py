@@ -35,6 +35,8 @@ class DatabaseConnection:
         self.logger = logger or logging.getLogger(__name__)
         self._connection: Optional[aiosqlite.Connection] = None
         self._lock = asyncio.Lock()
+        # Serializes transactions from concurrent tasks on the one connection
+        self._transaction_lock = asyncio.Lock()
         self._is_initialized = False
         
     async def connect(self) -> aiosqlite.Connection:
@@ -55,7 +57,7 @@ class DatabaseConnection:
                 self._connection = await aiosqlite.connect(
                     str(self.database_path),
                     timeout=30.0,  # 30 second timeout
-                    isolation_level=None,  # Auto-commit disabled for transactions
+                    isolation_level=None,  # Autocommit; transaction() issues BEGIN itself
                 )
                 
                 # Apply performance pragmas
@@ -84,6 +86,10 @@ class DatabaseConnection:
         """Close database connection."""
         async with self._lock:
             if self._connection:
+                try:
+                    await DatabaseSchema.apply_close_pragmas(self._connection)
+                except Exception as e:
+                    self.logger.debug(f"Close pragmas failed: {e}")
                 await self._connection.close()
                 self._connection = None
                 self.logger.debug("Database connection closed")
@@ -131,6 +137,9 @@ class DatabaseConnection:
         """
         Context manager for database transactions with automatic rollback on error.
         
+        Transactions started by concurrent tasks run one after another, so
+        they must not be nested.
+        
         Usage:
             async with db.transaction() as conn:
                 await conn.execute("INSERT ...")
@@ -139,19 +148,21 @@ class DatabaseConnection:
         """
         connection = await self.connect()
         
-        # Start transaction
-        await connection.execute("BEGIN")
-        
-        try:
-            yield connection
-            # Commit on successful completion
-            await connection.commit()
+        async with self._transaction_lock:
+            # Take the write lock up front; a deferred BEGIN that later
+            # upgrades to a writer can fail with SQLITE_BUSY mid-transaction
+            await connection.execute("BEGIN IMMEDIATE")
             
-        except Exception as e:
-            # Rollback on any exception
-            await connection.rollback()
-            self.logger.error(f"Transaction rolled back due to error: {e}")
-            raise
+            try:
+                yield connection
+                # Commit on successful completion
+                await connection.commit()
+                
+            except Exception as e:
+                # Rollback on any exception
+                await connection.rollback()
+                self.logger.error(f"Transaction rolled back due to error: {e}")
+                raise
     
     async def fetch_one(self, sql: str, parameters: Optional[tuple] = None) -> Optional[tuple]:
         """
@@ -190,7 +201,7 @@ class DatabaseConnection:
             # Get database info
             pragma_info = {}
             
-            for pragma in ["cache_size", "journal_mode", "synchronous", "foreign_keys"]:
+            for pragma in ["page_size", "cache_size", "journal_mode", "synchronous", "foreign_keys"]:
                 async with self._connection.execute(f"PRAGMA {pragma}") as cursor:
                     result = await cursor.fetchone()
                     pragma_info[pragma] = result[0] if result else None
@@ -254,6 +265,22 @@ class ConnectionManager:
         
         return self._connections[database_path]
     
+    async def release_connection(self, database_path: str) -> None:
+        """
+        Close a pooled connection and remove it from the pool.
+        
+        A later get_connection for the same path opens a fresh connection,
+        which matters for in-memory databases that vanish when closed.
+        
+        Args:
+            database_path: Path to database file
+        """
+        async with self._lock:
+            connection = self._connections.pop(database_path, None)
+            
+        if connection is not None:
+            await connection.close()
+    
     async def close_all(self) -> None:
         """Close all managed connections."""
         async with self._lock:
@@ -308,6 +335,17 @@ async def get_database_connection(
     return await _connection_manager.get_connection(database_path)
 
 
+async def release_database_connection(database_path: str) -> None:
+    """
+    Close and remove a connection from the global connection manager.
+    
+    Args:
+        database_path: Path to database file
+    """
+    if _connection_manager:
+        await _connection_manager.release_connection(database_path)
+
+
 async def close_all_connections() -> None:
     """Close all connections in global connection manager."""
     global _connection_manager
@@ -15,7 +15,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import hashlib
 import re
 
-from .connection import DatabaseConnection, get_database_connection
+from .connection import DatabaseConnection, get_database_connection, release_database_connection
 from .models import Document, DocumentMetadata, SearchIndex, SearchCache
 from .queries import DocumentQueries, SearchQueries, MetadataQueries
 from .migrations import MigrationManager, initialize_database
@@ -30,6 +30,17 @@ class DocumentManager:
     performance optimization and error handling.
     """
     
+    # Keyword tokenizer, compiled once rather than per indexed document
+    KEYWORD_PATTERN = re.compile(r'\b[a-zA-Z]{3,}\b')
+    
+    # Common stop words filtered out of the keyword index
+    STOP_WORDS = frozenset({
+        'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+        'by', 'from', 'this', 'that', 'these', 'those', 'a', 'an', 'is', 'are',
+        'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
+        'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'shall'
+    })
+    
     def __init__(
         self,
         database_path: str,
@@ -57,6 +68,10 @@ class DocumentManager:
         self.search_queries: Optional[SearchQueries] = None
         self.metadata_queries: Optional[MetadataQueries] = None
         
+        # Bumped after every write to stored documents so callers caching
+        # documents (e.g. getDocument) can tell their entries are stale
+        self.index_generation = 0
+        
         # Performance tracking
         self._query_stats = {
             "total_queries": 0,
@@ -110,7 +125,7 @@ class DocumentManager:
         file_path: str,
         content: str,
         metadata: Optional[Dict[str, Any]] = None,
-        extract_keywords: bool = True
+        extract_keywords: bool = False
     ) -> Optional[int]:
         """
         Index a document with full-text search and metadata extraction.
@@ -119,7 +134,8 @@ class DocumentManager:
             file_path: Path to the document file
             content: Document content to index
             metadata: Optional metadata dictionary
-            extract_keywords: Whether to extract keywords for search
+            extract_keywords: Whether to also fill the keyword search_index
+                table; search reads the FTS5 index, so this is off by default
             
         Returns:
             Document ID if successful, None otherwise
@@ -173,7 +189,8 @@ class DocumentManager:
             if extract_keywords:
                 await self._index_document_keywords(document_id, content)
             
-            # Invalidate related search cache
+            # Invalidate cached documents and related search cache
+            self.index_generation += 1
             await self._invalidate_search_cache()
             
             execution_time = (time.time() - start_time) * 1000
@@ -185,6 +202,72 @@ class DocumentManager:
             self.logger.error(f"Failed to index document {file_path}: {e}")
             return None
     
+    async def index_documents(
+        self,
+        documents: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+        extract_keywords: bool = False,
+        batch_size: int = 100
+    ) -> Dict[str, Optional[int]]:
+        """
+        Index multiple documents with one transaction per batch.
+        
+        Args:
+            documents: List of (file_path, content, metadata) tuples
+            extract_keywords: Whether to also fill the keyword search_index
+                table; search reads the FTS5 index, so this is off by default
+            batch_size: Maximum number of documents written per transaction
+            
+        Returns:
+            Dictionary mapping each file path to its document ID, or None if
+            the batch containing it failed
+        """
+        start_time = time.time()
+        document_ids: Dict[str, Optional[int]] = {}
+        
+        # Build document models and search entries up front
+        prepared = []
+        now = datetime.now()
+        for file_path, content, metadata in documents:
+            if not file_path or not content:
+                self.logger.error("File path and content are required")
+                document_ids[file_path] = None
+                continue
+                
+            document = Document(
+                file_path=file_path,
+                content=content,
+                file_size=len(content.encode('utf-8')),
+                created_at=now,
+                modified_at=now,
+                indexed_at=now
+            )
+            if metadata:
+                document.metadata = metadata
+                
+            search_entries = (
+                self._build_search_entries(content) if extract_keywords else []
+            )
+            prepared.append((document, metadata or {}, search_entries))
+            
+        for offset in range(0, len(prepared), batch_size):
+            batch = prepared[offset:offset + batch_size]
+            try:
+                document_ids.update(await self.doc_queries.bulk_index_documents(batch))
+            except Exception as e:
+                self.logger.error(f"Failed to index batch of {len(batch)} documents: {e}")
+                for document, _, _ in batch:
+                    document_ids[document.file_path] = None
+                    
+        # Invalidate cached documents and related search cache once for
+        # the whole run
+        self.index_generation += 1
+        await self._invalidate_search_cache()
+        
+        execution_time = (time.time() - start_time) * 1000
+        self.logger.info(f"Indexed {len(prepared)} documents in {execution_time:.2f}ms")
+        
+        return document_ids
+    
     async def search_documents(
         self,
         query: str,
@@ -299,6 +382,33 @@ class DocumentManager:
             self.logger.error(f"Failed to get document {document_id}: {e}")
             return None
     
+    async def touch_document(self, document_id: int) -> Optional[datetime]:
+        """
+        Record that a document was found unchanged on disk.
+        
+        Moves its modified_at and indexed_at forward so later modification
+        time checks treat the document as up to date, without rewriting or
+        re-tokenizing its content.
+        
+        Args:
+            document_id: Document ID to update
+            
+        Returns:
+            The new indexed_at timestamp, or None if the update failed
+        """
+        try:
+            timestamp = datetime.now()
+            if not await self.doc_queries.touch_document(document_id, timestamp):
+                return None
+                
+            # Cached copies of the document carry the old timestamps
+            self.index_generation += 1
+            return timestamp
+            
+        except Exception as e:
+            self.logger.error(f"Failed to touch document {document_id}: {e}")
+            return None
+    
     async def delete_document(self, document_id: int) -> bool:
         """
         Delete document and all related data.
@@ -320,7 +430,8 @@ class DocumentManager:
             success = await self.doc_queries.delete_document(document_id)
             
             if success:
-                # Invalidate search cache
+                # Invalidate cached documents and search cache
+                self.index_generation += 1
                 await self._invalidate_search_cache()
                 self.logger.info(f"Deleted document {document_id}")
             
@@ -378,32 +489,39 @@ class DocumentManager:
             # Clean up existing search index for this document
             await self.search_queries.delete_search_index_for_document(document_id)
             
-            # Extract keywords (simple tokenization for MVP)
-            keywords = self._extract_keywords(content)
-            
             # Create search index entries
-            search_entries = []
-            document_length = len(content.split())
-            
-            for keyword, positions in keywords.items():
-                search_index = SearchIndex(
-                    document_id=document_id,
-                    keyword=keyword.lower(),
-                    frequency=len(positions)
-                )
-                search_index.positions = positions
-                
-                # Calculate relevance score
-                search_index.calculate_relevance_score(document_length)
-                search_entries.append(search_index)
+            search_entries = self._build_search_entries(content, document_id)
             
             # Bulk insert for performance
             if search_entries:
                 await self.search_queries.bulk_create_search_index(search_entries)
-            
+                
         except Exception as e:
             self.logger.error(f"Failed to index keywords for document {document_id}: {e}")
     
+    def _build_search_entries(self, content: str, document_id: int = 0) -> List[SearchIndex]:
+        """Build scored search index entries for document content."""
+        # Extract keywords (simple tokenization for MVP)
+        keywords = self._extract_keywords(content)
+        
+        search_entries = []
+        document_length = len(content.split())
+        
+        for keyword, positions in keywords.items():
+            # Keywords are already lowercased by _extract_keywords
+            search_index = SearchIndex(
+                document_id=document_id,
+                keyword=keyword,
+                frequency=len(positions)
+            )
+            search_index.positions = positions
+            
+            # Calculate relevance score
+            search_index.calculate_relevance_score(document_length)
+            search_entries.append(search_index)
+            
+        return search_entries
+    
     def _extract_keywords(self, content: str) -> Dict[str, List[int]]:
         """
         Extract keywords from content with position tracking.
@@ -414,23 +532,19 @@ class DocumentManager:
         Returns:
             Dictionary mapping keywords to position lists
         """
-        # Simple tokenization (can be enhanced with NLP libraries)
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', content.lower())
-        
-        # Filter out common stop words
-        stop_words = {
-            'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'from', 'this', 'that', 'these', 'those', 'a', 'an', 'is', 'are',
-            'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
-            'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'shall'
-        }
+        # Simple tokenization (can be enhanced with NLP libraries); the
+        # pattern only matches words of three or more letters
+        words = self.KEYWORD_PATTERN.findall(content.lower())
+        stop_words = self.STOP_WORDS
         
-        keywords = {}
+        keywords: Dict[str, List[int]] = {}
         for position, word in enumerate(words):
-            if word not in stop_words and len(word) >= 3:
-                if word not in keywords:
-                    keywords[word] = []
-                keywords[word].append(position)
+            if word not in stop_words:
+                positions = keywords.get(word)
+                if positions is None:
+                    keywords[word] = [position]
+                else:
+                    positions.append(position)
         
         return keywords
     
@@ -540,7 +654,9 @@ class DocumentManager:
         """Close database manager and cleanup resources."""
         try:
             if self.db_connection:
-                await self.db_connection.close()
+                # Evict the pooled connection so the path can be reopened
+                await release_database_connection(self.database_path)
+                self.db_connection = None
                 self.logger.info("Document manager closed successfully")
                 
         except Exception as e:
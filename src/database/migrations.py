@@ -163,6 +163,87 @@ class Migration002_AddDocumentTags(Migration):
         await connection.commit()
 
 
+class Migration003_ExternalContentFTS(Migration):
+    """
+    Rebuild documents_fts as an external-content FTS5 table.
+    
+    The original table stored a second copy of every document. The new one
+    indexes the documents table directly, uses the porter stemmer and is
+    queried with MATCH and bm25() by searchDocuments.
+    """
+    
+    # Legacy content-bearing table, restored on rollback
+    LEGACY_FTS_TABLE = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+        file_name,
+        content,
+        file_type
+    );
+    """
+    
+    LEGACY_FTS_TRIGGERS = [
+        """
+        CREATE TRIGGER IF NOT EXISTS documents_fts_insert AFTER INSERT ON documents
+        BEGIN
+            INSERT INTO documents_fts(rowid, file_name, content, file_type)
+            VALUES (NEW.id, NEW.file_name, NEW.content, NEW.file_type);
+        END;
+        """,
+        
+        """
+        CREATE TRIGGER IF NOT EXISTS documents_fts_update AFTER UPDATE ON documents
+        BEGIN
+            UPDATE documents_fts 
+            SET file_name = NEW.file_name, 
+                content = NEW.content, 
+                file_type = NEW.file_type
+            WHERE rowid = NEW.id;
+        END;
+        """,
+        
+        """
+        CREATE TRIGGER IF NOT EXISTS documents_fts_delete AFTER DELETE ON documents
+        BEGIN
+            DELETE FROM documents_fts WHERE rowid = OLD.id;
+        END;
+        """
+    ]
+    
+    def __init__(self):
+        super().__init__(3, "Rebuild documents_fts as external-content FTS5 table")
+    
+    async def _drop_fts(self, connection: aiosqlite.Connection) -> None:
+        """Drop the FTS sync triggers and virtual table."""
+        for trigger_name in DatabaseSchema.FTS_TRIGGER_NAMES:
+            await connection.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+        await connection.execute("DROP TABLE IF EXISTS documents_fts")
+    
+    async def upgrade(self, connection: aiosqlite.Connection) -> None:
+        """Recreate documents_fts over the documents table and rebuild it."""
+        await self._drop_fts(connection)
+        
+        await connection.execute(DatabaseSchema.CREATE_FTS_TABLE)
+        for trigger_sql in DatabaseSchema.CREATE_FTS_TRIGGERS:
+            await connection.execute(trigger_sql)
+            
+        await connection.execute(DatabaseSchema.REBUILD_FTS)
+        await connection.commit()
+    
+    async def rollback(self, connection: aiosqlite.Connection) -> None:
+        """Restore the content-bearing documents_fts table."""
+        await self._drop_fts(connection)
+        
+        await connection.execute(self.LEGACY_FTS_TABLE)
+        for trigger_sql in self.LEGACY_FTS_TRIGGERS:
+            await connection.execute(trigger_sql)
+            
+        await connection.execute("""
+            INSERT INTO documents_fts(rowid, file_name, content, file_type)
+            SELECT id, file_name, content, file_type FROM documents
+        """)
+        await connection.commit()
+
+
 class MigrationManager:
     """
     Database migration management system.
@@ -191,6 +272,7 @@ class MigrationManager:
         migrations = [
             Migration001_Initial(),
             Migration002_AddDocumentTags(),
+            Migration003_ExternalContentFTS(),
         ]
         
         for migration in migrations:
@@ -238,17 +238,22 @@ class DatabaseSchema:
     # Schema version for migrations
     SCHEMA_VERSION = 1
     
-    # SQLite performance optimization pragmas
+    # SQLite performance optimization pragmas (applied in order, before any DDL)
     PERFORMANCE_PRAGMAS = {
+        'page_size': 32768,           # 32KB pages; only takes effect before the first table
         'journal_mode': 'WAL',        # Write-ahead logging for better concurrency
         'synchronous': 'NORMAL',      # Balance between safety and performance
-        'cache_size': -64000,         # 64MB cache size (negative = KB)
+        'cache_size': -65536,         # 64MB cache size (negative = KB)
         'temp_store': 'MEMORY',       # Store temporary tables in memory
         'mmap_size': 268435456,       # 256MB memory-mapped I/O size
         'foreign_keys': 'ON',         # Enable foreign key constraints
-        'optimize': None,             # Auto-optimize on close
     }
     
+    # Pragmas run before a connection is closed
+    CLOSE_PRAGMAS = [
+        'optimize',                   # Refresh query planner statistics
+    ]
+    
     # Core table creation DDL
     CREATE_DOCUMENTS_TABLE = """
     CREATE TABLE IF NOT EXISTS documents (
@@ -353,16 +358,21 @@ class DatabaseSchema:
         "CREATE INDEX IF NOT EXISTS idx_search_freq_score ON search_index(frequency DESC, relevance_score DESC);",
     ]
     
-    # Full-text search virtual table for advanced search
+    # Full-text search virtual table for advanced search. External content:
+    # the text lives in documents and FTS5 only stores the index.
     CREATE_FTS_TABLE = """
     CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
         file_name,
         content,
-        file_type
+        file_type,
+        content='documents',
+        content_rowid='id',
+        tokenize='porter unicode61'
     );
     """
     
-    # Trigger to maintain FTS table sync
+    # Triggers to maintain FTS table sync (external content tables are
+    # updated through the special 'delete' command)
     CREATE_FTS_TRIGGERS = [
         """
         CREATE TRIGGER IF NOT EXISTS documents_fts_insert AFTER INSERT ON documents
@@ -372,25 +382,37 @@ class DatabaseSchema:
         END;
         """,
         
+        # Only changes to indexed columns need re-tokenizing
         """
-        CREATE TRIGGER IF NOT EXISTS documents_fts_update AFTER UPDATE ON documents
+        CREATE TRIGGER IF NOT EXISTS documents_fts_update
+        AFTER UPDATE OF file_name, content, file_type ON documents
         BEGIN
-            UPDATE documents_fts 
-            SET file_name = NEW.file_name, 
-                content = NEW.content, 
-                file_type = NEW.file_type
-            WHERE rowid = NEW.id;
+            INSERT INTO documents_fts(documents_fts, rowid, file_name, content, file_type)
+            VALUES ('delete', OLD.id, OLD.file_name, OLD.content, OLD.file_type);
+            INSERT INTO documents_fts(rowid, file_name, content, file_type)
+            VALUES (NEW.id, NEW.file_name, NEW.content, NEW.file_type);
         END;
         """,
         
         """
         CREATE TRIGGER IF NOT EXISTS documents_fts_delete AFTER DELETE ON documents
         BEGIN
-            DELETE FROM documents_fts WHERE rowid = OLD.id;
+            INSERT INTO documents_fts(documents_fts, rowid, file_name, content, file_type)
+            VALUES ('delete', OLD.id, OLD.file_name, OLD.content, OLD.file_type);
         END;
         """
     ]
     
+    # Names of the FTS sync triggers, in creation order
+    FTS_TRIGGER_NAMES = [
+        "documents_fts_insert",
+        "documents_fts_update",
+        "documents_fts_delete"
+    ]
+    
+    # Repopulate the FTS index from the documents table
+    REBUILD_FTS = "INSERT INTO documents_fts(documents_fts) VALUES ('rebuild')"
+    
     @classmethod
     def get_all_ddl_statements(cls) -> List[str]:
         """Get all DDL statements in proper order."""
@@ -419,6 +441,12 @@ class DatabaseSchema:
             else:
                 await connection.execute(f"PRAGMA {pragma}")
     
+    @classmethod
+    async def apply_close_pragmas(cls, connection: aiosqlite.Connection) -> None:
+        """Apply SQLite maintenance pragmas before closing a connection."""
+        for pragma in cls.CLOSE_PRAGMAS:
+            await connection.execute(f"PRAGMA {pragma}")
+    
     @classmethod
     async def initialize_schema(cls, connection: aiosqlite.Connection) -> None:
         """Initialize the complete database schema."""
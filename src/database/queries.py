@@ -209,6 +209,142 @@ class DocumentQueries:
             self.logger.error(f"Failed to update document {document.id}: {e}")
             raise
     
+    @monitor_query_performance
+    async def touch_document(self, document_id: int, timestamp: datetime) -> bool:
+        """
+        Mark an unchanged document as modified and indexed at a new time.
+        
+        Args:
+            document_id: Document ID to update
+            timestamp: New modified_at and indexed_at value
+            
+        Returns:
+            True if the document was updated, False otherwise
+        """
+        sql = "UPDATE documents SET modified_at = ?, indexed_at = ? WHERE id = ?"
+        
+        try:
+            cursor = await self.db.execute(sql, (timestamp, timestamp, document_id))
+            await self.db.commit()
+            return cursor.rowcount > 0
+            
+        except Exception as e:
+            self.logger.error(f"Failed to touch document {document_id}: {e}")
+            raise
+    
+    @monitor_query_performance
+    async def bulk_index_documents(
+        self,
+        batch: List[Tuple[Document, Dict[str, str], List[SearchIndex]]]
+    ) -> Dict[str, int]:
+        """
+        Create or update a batch of documents in a single transaction.
+        
+        Documents, their metadata and their search index entries are written
+        with one executemany per table instead of one transaction per row.
+        
+        Args:
+            batch: List of (document, metadata, search entries) tuples. Search
+                entries are assigned their document ID inside the transaction.
+                
+        Returns:
+            Dictionary mapping file paths to document IDs
+        """
+        upsert_sql = """
+        INSERT INTO documents (
+            file_path, file_name, content, file_type, file_size, file_hash,
+            created_at, modified_at, indexed_at, metadata_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(file_path) DO UPDATE SET
+            file_name = excluded.file_name,
+            content = excluded.content,
+            file_type = excluded.file_type,
+            file_size = excluded.file_size,
+            file_hash = excluded.file_hash,
+            modified_at = excluded.modified_at,
+            indexed_at = excluded.indexed_at,
+            metadata_json = excluded.metadata_json
+        """
+        
+        metadata_sql = """
+        INSERT OR REPLACE INTO document_metadata (
+            document_id, key, value, extracted_at
+        ) VALUES (?, ?, ?, ?)
+        """
+        
+        search_sql = """
+        INSERT OR REPLACE INTO search_index (
+            document_id, keyword, frequency, position_data, relevance_score
+        ) VALUES (?, ?, ?, ?, ?)
+        """
+        
+        if not batch:
+            return {}
+            
+        try:
+            current_time = datetime.now()
+            file_paths = [document.file_path for document, _, _ in batch]
+            placeholders = ",".join("?" * len(file_paths))
+            
+            async with self.db.transaction() as conn:
+                await conn.executemany(upsert_sql, [
+                    (
+                        document.file_path,
+                        document.file_name,
+                        document.content,
+                        document.file_type,
+                        document.file_size,
+                        document.file_hash,
+                        document.created_at,
+                        document.modified_at,
+                        document.indexed_at or current_time,
+                        document.metadata_json
+                    )
+                    for document, _, _ in batch
+                ])
+                
+                async with conn.execute(
+                    f"SELECT id, file_path FROM documents WHERE file_path IN ({placeholders})",
+                    file_paths
+                ) as cursor:
+                    document_ids = {row[1]: row[0] for row in await cursor.fetchall()}
+                    
+                await conn.executemany(
+                    "DELETE FROM search_index WHERE document_id = ?",
+                    [(document_ids[path],) for path in file_paths]
+                )
+                
+                metadata_params = []
+                search_params = []
+                for document, metadata, search_entries in batch:
+                    document_id = document_ids[document.file_path]
+                    metadata_params.extend(
+                        (document_id, key, value, current_time)
+                        for key, value in metadata.items()
+                    )
+                    for entry in search_entries:
+                        entry.document_id = document_id
+                        search_params.append((
+                            entry.document_id,
+                            entry.keyword,
+                            entry.frequency,
+                            entry.position_data,
+                            entry.relevance_score
+                        ))
+                        
+                if metadata_params:
+                    await conn.executemany(metadata_sql, metadata_params)
+                    
+                if search_params:
+                    await conn.executemany(search_sql, search_params)
+                    
+                self.logger.debug(f"Bulk indexed {len(batch)} documents")
+                return document_ids
+                
+        except Exception as e:
+            self.logger.error(f"Failed to bulk index documents: {e}")
+            raise
+    
     @monitor_query_performance
     async def delete_document(self, document_id: int) -> bool:
         """
@@ -333,6 +469,30 @@ class SearchQueries:
     for optimal search performance.
     """
     
+    # FTS candidates fetched per requested row when results are filtered
+    FILTERED_CANDIDATE_FACTOR = 10
+    
+    # Materialize the FTS hits first and join/filter afterwards; mixing
+    # MATCH with document filters in one WHERE clause can make the planner
+    # scan documents instead of driving the query from the index
+    SEARCH_SQL = """
+    WITH fts_matches AS (
+        SELECT rowid, bm25(documents_fts) AS rank
+        FROM documents_fts
+        WHERE documents_fts MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    )
+    SELECT d.id, d.file_path, d.file_name, d.content, d.file_type, 
+           d.file_size, d.file_hash, d.created_at, d.modified_at, 
+           d.indexed_at, d.metadata_json, f.rank
+    FROM fts_matches f
+    JOIN documents d ON d.id = f.rowid
+    WHERE (? IS NULL OR d.file_type = ?)
+    ORDER BY f.rank, d.indexed_at DESC
+    LIMIT ? OFFSET ?
+    """
+    
     def __init__(self, connection: DatabaseConnection, logger: Optional[logging.Logger] = None):
         """
         Initialize search queries.
@@ -428,7 +588,11 @@ class SearchQueries:
         file_type_filter: Optional[str] = None
     ) -> List[Tuple[Document, float]]:
         """
-        Search documents using keyword matching.
+        Search documents using the FTS5 index, ranked by bm25().
+        
+        Each query term is matched as a quoted FTS5 string and the terms are
+        OR-ed together, so any keyword can match and FTS5 query syntax in the
+        user's input is never interpreted.
         
         Args:
             query: Search query string
@@ -441,43 +605,40 @@ class SearchQueries:
         """
         # Split query into keywords and normalize
         keywords = [kw.lower().strip() for kw in query.split() if kw.strip()]
+        match_expression = self._build_match_expression(keywords)
         
-        if not keywords:
+        if not match_expression:
             return []
         
-        # Build search query with keyword matching
-        keyword_placeholders = ",".join("?" for _ in keywords)
-        
-        base_sql = """
-        SELECT DISTINCT d.id, d.file_path, d.file_name, d.content, d.file_type, 
-               d.file_size, d.file_hash, d.created_at, d.modified_at, 
-               d.indexed_at, d.metadata_json,
-               SUM(si.relevance_score * si.frequency) as total_score
-        FROM documents d
-        JOIN search_index si ON d.id = si.document_id
-        WHERE si.keyword IN ({})
-        """.format(keyword_placeholders)
-        
-        params = list(keywords)
-        
-        # Add file type filter if specified
+        candidate_limit = limit + offset
         if file_type_filter:
-            base_sql += " AND d.file_type = ?"
-            params.append(file_type_filter)
+            # Widen the candidate set so filtering still leaves enough rows
+            candidate_limit *= self.FILTERED_CANDIDATE_FACTOR
         
-        # Group by document and order by relevance
-        sql = f"""
-        {base_sql}
-        GROUP BY d.id
-        ORDER BY total_score DESC, d.indexed_at DESC
-        LIMIT ? OFFSET ?
-        """
-        
-        params.extend([limit, offset])
+        sql = self.SEARCH_SQL
+        params = (
+            match_expression, candidate_limit,
+            file_type_filter, file_type_filter,
+            limit, offset
+        )
         
         try:
-            rows = await self.db.fetch_all(sql, tuple(params))
+            rows = await self.db.fetch_all(sql, params)
             
+            if file_type_filter and len(rows) < limit:
+                # The filter may have discarded most of a full candidate set;
+                # if more matches exist beyond the cap, rerun without it
+                overflow = await self.db.fetch_one(
+                    "SELECT 1 FROM documents_fts WHERE documents_fts MATCH ? LIMIT 1 OFFSET ?",
+                    (match_expression, candidate_limit)
+                )
+                if overflow:
+                    rows = await self.db.fetch_all(sql, (
+                        match_expression, -1,
+                        file_type_filter, file_type_filter,
+                        limit, offset
+                    ))
+                    
             results = []
             for row in rows:
                 document = Document(
@@ -494,7 +655,8 @@ class SearchQueries:
                     metadata_json=row[10]
                 )
                 
-                relevance_score = float(row[11]) if row[11] else 0.0
+                # bm25() is negative, convert to positive relevance score
+                relevance_score = -float(row[11]) if row[11] else 0.0
                 results.append((document, relevance_score))
             
             self.logger.debug(f"Found {len(results)} search results for query: {query}")
@@ -504,6 +666,26 @@ class SearchQueries:
             self.logger.error(f"Failed to search documents: {e}")
             raise
     
+    @staticmethod
+    def _build_match_expression(keywords: List[str]) -> str:
+        """
+        Build an FTS5 MATCH expression that ORs the given keywords.
+        
+        Args:
+            keywords: Normalized query keywords
+            
+        Returns:
+            MATCH expression, or an empty string if no keyword is searchable
+        """
+        # Keywords without word characters tokenize to nothing and would
+        # make FTS5 reject the whole expression
+        terms = [
+            '"{}"'.format(kw.replace('"', '""'))
+            for kw in keywords
+            if any(ch.isalnum() for ch in kw)
+        ]
+        return " OR ".join(terms)
+    
     @monitor_query_performance
     async def full_text_search(
         self,
@@ -7,24 +7,29 @@ with metadata extraction and keyword generation.
 """
 
 import asyncio
+import copy
 import hashlib
 import logging
+import mmap
+import os
 import re
 import time
 from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
-import aiofiles
 
 
-@dataclass
+@dataclass(slots=True)
 class ParserResult:
     """
     Result from document parsing operation.
     
     Contains parsed content, extracted metadata, keywords, and parsing statistics.
+    Slotted, so instances carry no per-instance __dict__.
     """
     content: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -47,17 +52,26 @@ class ParserResult:
                 "metadata_fields": len(self.metadata)
             }
     
+    def copy(self) -> "ParserResult":
+        """
+        Create a copy that shares no mutable state with this result.
+        
+        Returns:
+            New ParserResult with copied containers
+        """
+        return ParserResult(
+            content=self.content,
+            metadata=copy.deepcopy(self.metadata),
+            keywords=list(self.keywords),
+            file_info=dict(self.file_info),
+            parsing_stats=dict(self.parsing_stats),
+            success=self.success,
+            error_message=self.error_message
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert parser result to dictionary for serialization."""
-        return {
-            "content": self.content,
-            "metadata": self.metadata,
-            "keywords": self.keywords,
-            "file_info": self.file_info,
-            "parsing_stats": self.parsing_stats,
-            "success": self.success,
-            "error_message": self.error_message
-        }
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class DocumentParser(ABC):
@@ -70,7 +84,7 @@ class DocumentParser(ABC):
     """
     
     # Default stop words for keyword extraction
-    STOP_WORDS = {
+    STOP_WORDS = frozenset({
         'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
         'by', 'from', 'this', 'that', 'these', 'those', 'a', 'an', 'is', 'are',
         'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
@@ -85,7 +99,25 @@ class DocumentParser(ABC):
         'let', 'begin', 'seem', 'help', 'talk', 'turn', 'start', 'show', 'hear',
         'play', 'run', 'move', 'like', 'live', 'believe', 'hold', 'bring', 'happen',
         'write', 'provide', 'sit', 'stand', 'lose', 'pay', 'meet', 'include', 'continue'
-    }
+    })
+    
+    # Patterns shared by all parsers, compiled once at import
+    WORD_PATTERN = re.compile(r'\b[a-zA-Z0-9_]+\b')
+    EXCESS_NEWLINES_PATTERN = re.compile(r'\n{3,}')
+    INLINE_WHITESPACE_PATTERN = re.compile(r'[ \t]+')
+    
+    # Bounds on the parse results kept for re-parses of unchanged content:
+    # entry count, total content characters, and the largest content cached
+    PARSE_CACHE_SIZE = 1024
+    PARSE_CACHE_MAX_CHARS = 32_000_000
+    PARSE_CACHE_MAX_ENTRY_CHARS = 1_000_000
+    
+    # Files below this size are read with one threaded read_bytes call;
+    # larger files are decoded straight from a memory map
+    THREAD_READ_MAX_BYTES = 1_000_000
+    
+    # Content at least this long is hashed in a worker thread
+    THREAD_HASH_MIN_CHARS = 1_000_000
     
     def __init__(self, 
                  logger: Optional[logging.Logger] = None,
@@ -114,6 +146,11 @@ class DocumentParser(ABC):
         self._parse_count = 0
         self._total_parse_time = 0.0
         self._error_count = 0
+        
+        # Successful results as (content hash, result, content length), keyed
+        # by file path, or by content hash for content parsed without a path
+        self._parse_cache: "OrderedDict[str, Tuple[str, ParserResult, int]]" = OrderedDict()
+        self._parse_cache_chars = 0
     
     @abstractmethod
     def get_supported_extensions(self) -> Set[str]:
@@ -139,17 +176,20 @@ class DocumentParser(ABC):
         """
         pass
     
-    async def parse_file(self, file_path: Union[str, Path]) -> ParserResult:
+    async def parse_file(self,
+                         file_path: Union[str, Path],
+                         executor: Optional[Executor] = None) -> ParserResult:
         """
         Parse a document file from disk.
         
         Args:
             file_path: Path to the document file
+            executor: Optional executor that parses the content on a cache miss
             
         Returns:
             ParserResult containing parsed data
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             file_path = Path(file_path)
@@ -175,13 +215,20 @@ class DocumentParser(ABC):
                 )
             
             # Read file content
+            file_stat = file_path.stat()
             if self.enable_async:
-                content = await self._read_file_async(file_path)
+                content = await self._read_file_async(file_path, file_stat.st_size)
             else:
                 content = await self._read_file_sync(file_path)
             
+            # hashlib releases the GIL on large inputs, so big files are
+            # hashed off the event loop while other requests keep running
+            if len(content) >= self.THREAD_HASH_MIN_CHARS:
+                file_hash = await asyncio.to_thread(self._calculate_file_hash, content)
+            else:
+                file_hash = self._calculate_file_hash(content)
+                
             # Extract basic file information
-            file_stat = file_path.stat()
             file_info = {
                 "file_path": str(file_path.absolute()),
                 "file_name": file_path.name,
@@ -189,17 +236,20 @@ class DocumentParser(ABC):
                 "file_extension": file_path.suffix.lower(),
                 "created_at": datetime.fromtimestamp(file_stat.st_ctime),
                 "modified_at": datetime.fromtimestamp(file_stat.st_mtime),
-                "file_hash": self._calculate_file_hash(content)
+                "file_hash": file_hash
             }
             
             # Parse content
-            result = await self.parse_content(content, str(file_path))
+            result = await self.parse_content_cached(
+                content, str(file_path), content_hash=file_info["file_hash"],
+                executor=executor
+            )
             
             # Add file information to result
             result.file_info.update(file_info)
             
             # Update parsing statistics
-            parse_time = (time.time() - start_time) * 1000
+            parse_time = (time.perf_counter_ns() - start_time) / 1e6
             result.parsing_stats.update({
                 "parse_time_ms": parse_time,
                 "parser_name": self.parser_name,
@@ -229,11 +279,79 @@ class DocumentParser(ABC):
                 success=False,
                 error_message=error_msg,
                 parsing_stats={
-                    "parse_time_ms": (time.time() - start_time) * 1000,
+                    "parse_time_ms": (time.perf_counter_ns() - start_time) / 1e6,
                     "parser_name": self.parser_name
                 }
             )
     
+    async def parse_content_cached(self,
+                                   content: str,
+                                   file_path: Optional[str] = None,
+                                   content_hash: Optional[str] = None,
+                                   executor: Optional[Executor] = None) -> ParserResult:
+        """
+        Parse content, reusing the result of an earlier parse of identical content.
+        
+        Args:
+            content: Document content to parse
+            file_path: Optional file path for context
+            content_hash: SHA-256 of content, if the caller already has it
+            executor: Optional process pool to run an uncached parse in
+            
+        Returns:
+            ParserResult containing parsed data, with parsing_stats["cache_hit"]
+            and parsing_stats["parse_time_ms"] set
+        """
+        start_time = time.perf_counter_ns()
+        
+        # Parsers derive metadata from the path, so each path has its own
+        # entry and an edited file replaces its stale result
+        content_hash = content_hash or self._calculate_file_hash(content)
+        cache_key = file_path if file_path is not None else content_hash
+        cached_result = None
+        entry = self._parse_cache.get(cache_key)
+        if entry is not None and entry[0] == content_hash:
+            cached_result = entry[1]
+        
+        if cached_result is not None:
+            self._parse_cache.move_to_end(cache_key)
+            result = cached_result.copy()
+        else:
+            if executor is not None:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    executor, _parse_content_sync, self, content, file_path
+                )
+            else:
+                result = await self.parse_content(content, file_path)
+            if result.success:
+                self._cache_parse_result(cache_key, content_hash, result, len(content))
+                
+        result.parsing_stats["cache_hit"] = cached_result is not None
+        result.parsing_stats["parse_time_ms"] = (time.perf_counter_ns() - start_time) / 1e6
+        return result
+    
+    def _cache_parse_result(self,
+                            cache_key: str,
+                            content_hash: str,
+                            result: ParserResult,
+                            content_chars: int) -> None:
+        """Store a parse result, evicting the oldest entries to stay in bounds."""
+        stale = self._parse_cache.pop(cache_key, None)
+        if stale is not None:
+            self._parse_cache_chars -= stale[2]
+            
+        # Results hold the whole content, so very large files are not cached
+        if content_chars > self.PARSE_CACHE_MAX_ENTRY_CHARS:
+            return
+            
+        self._parse_cache[cache_key] = (content_hash, result.copy(), content_chars)
+        self._parse_cache_chars += content_chars
+        while (len(self._parse_cache) > self.PARSE_CACHE_SIZE
+               or self._parse_cache_chars > self.PARSE_CACHE_MAX_CHARS):
+            _, evicted = self._parse_cache.popitem(last=False)
+            self._parse_cache_chars -= evicted[2]
+    
     def supports_file(self, file_path: Union[str, Path]) -> bool:
         """
         Check if this parser supports the given file type.
@@ -247,43 +365,57 @@ class DocumentParser(ABC):
         extension = Path(file_path).suffix.lower()
         return extension in self.get_supported_extensions()
     
-    async def _read_file_async(self, file_path: Path) -> str:
+    async def _read_file_async(self, file_path: Path, file_size: int) -> str:
         """Read file content asynchronously."""
-        try:
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as file:
-                return await file.read()
-        except UnicodeDecodeError:
-            # Fallback to binary reading for encoding detection
-            async with aiofiles.open(file_path, 'rb') as file:
-                content_bytes = await file.read()
-                # Try common encodings
-                for encoding in ['utf-8', 'utf-16', 'latin-1', 'cp1252']:
-                    try:
-                        return content_bytes.decode(encoding)
-                    except UnicodeDecodeError:
-                        continue
-                # Final fallback - replace errors
-                return content_bytes.decode('utf-8', errors='replace')
+        # One binary read, decoded in-process, so a non-UTF-8 file is not
+        # opened and read a second time. Each path is a single worker thread
+        # dispatch rather than separate open/read/close round trips
+        if file_size < self.THREAD_READ_MAX_BYTES:
+            content_bytes = await asyncio.to_thread(file_path.read_bytes)
+            return self._decode_content(content_bytes)
+        return await asyncio.to_thread(self._read_file_mapped, file_path)
+    
+    def _read_file_mapped(self, file_path: Path) -> str:
+        """Decode a large file directly from a read-only memory map."""
+        # Decoding from the mapped pages skips copying the whole file into
+        # an intermediate bytes object first
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self._decode_content(mapped)
     
     async def _read_file_sync(self, file_path: Path) -> str:
         """Read file content synchronously (fallback)."""
-        def _read():
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    return file.read()
-            except UnicodeDecodeError:
-                with open(file_path, 'rb') as file:
-                    content_bytes = file.read()
-                    for encoding in ['utf-8', 'utf-16', 'latin-1', 'cp1252']:
-                        try:
-                            return content_bytes.decode(encoding)
-                        except UnicodeDecodeError:
-                            continue
-                    return content_bytes.decode('utf-8', errors='replace')
-        
         # Run in executor to avoid blocking
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _read)
+        content_bytes = await loop.run_in_executor(None, file_path.read_bytes)
+        return self._decode_content(content_bytes)
+    
+    def _decode_content(self, content_bytes: Union[bytes, mmap.mmap]) -> str:
+        """
+        Decode raw file content, trying common encodings.
+        
+        Args:
+            content_bytes: Raw file content, as bytes or a memory map
+            
+        Returns:
+            Decoded text content
+        """
+        try:
+            # Match text-mode reads, which translate universal newlines
+            return str(content_bytes, 'utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        except UnicodeDecodeError:
+            pass
+            
+        # Try common encodings
+        for encoding in ['utf-16', 'latin-1', 'cp1252']:
+            try:
+                return str(content_bytes, encoding)
+            except UnicodeDecodeError:
+                continue
+        # Final fallback - replace errors
+        return str(content_bytes, 'utf-8', errors='replace')
     
     def _calculate_file_hash(self, content: str) -> str:
         """Calculate SHA-256 hash of file content."""
@@ -303,25 +435,22 @@ class DocumentParser(ABC):
         if not content:
             return []
         
-        # Combine default and custom stop words
-        stop_words = self.STOP_WORDS.copy()
-        if custom_stop_words:
-            stop_words.update(custom_stop_words)
-        
-        # Extract words (alphanumeric, minimum length)
-        words = re.findall(r'\b[a-zA-Z0-9_]+\b', content.lower())
+        stop_words = self.STOP_WORDS
+        custom_stop_words = custom_stop_words or ()
+        min_length = self.min_keyword_length
         
-        # Filter and count words
-        word_freq = {}
-        for word in words:
-            if (len(word) >= self.min_keyword_length and 
+        # Tokenize, filter and count in a single pass over the content,
+        # checking both stop word sets instead of merging them per call
+        word_freq = Counter(
+            word for word in self.WORD_PATTERN.findall(content.lower())
+            if (len(word) >= min_length and
                 word not in stop_words and
-                not word.isdigit()):
-                word_freq[word] = word_freq.get(word, 0) + 1
+                word not in custom_stop_words and
+                not word.isdigit())
+        )
         
-        # Sort by frequency and limit results
-        keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, freq in keywords[:self.max_keywords]]
+        # Most frequent first; ties keep first-occurrence order
+        return [word for word, _ in word_freq.most_common(self.max_keywords)]
     
     def get_parser_stats(self) -> Dict[str, Any]:
         """
@@ -348,12 +477,24 @@ class DocumentParser(ABC):
             )
         }
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the parser configuration without its parse cache."""
+        state = self.__dict__.copy()
+        state['_parse_cache'] = OrderedDict()
+        state['_parse_cache_chars'] = 0
+        return state
+    
     def reset_stats(self) -> None:
         """Reset parser performance statistics."""
         self._parse_count = 0
         self._total_parse_time = 0.0
         self._error_count = 0
     
+    def clear_parse_cache(self) -> None:
+        """Drop all cached parse results."""
+        self._parse_cache.clear()
+        self._parse_cache_chars = 0
+    
     def __str__(self) -> str:
         """String representation of parser."""
         extensions = ', '.join(self.get_supported_extensions())
@@ -367,6 +508,11 @@ class DocumentParser(ABC):
                 f"max_keywords={self.max_keywords})")
 
 
+def _parse_content_sync(parser: DocumentParser, content: str, file_path: Optional[str]) -> ParserResult:
+    """Run a parser's parse_content to completion in a worker process."""
+    return asyncio.run(parser.parse_content(content, file_path))
+
+
 class ParseError(Exception):
     """Exception raised when document parsing fails."""
     
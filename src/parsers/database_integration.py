@@ -127,8 +127,7 @@ async def index_parsed_document(
         doc_id = await document_manager.index_document(
             file_path=file_path,
             content=parser_result.content,
-            metadata=normalized_metadata,
-            extract_keywords=True  # Let database manager handle keyword extraction too
+            metadata=normalized_metadata
         )
         
         if doc_id:
@@ -14,6 +14,13 @@ from pathlib import Path
 
 from .base import DocumentParser, ParserResult, ParseError
 
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml only
+# ship the pure-Python one
+try:
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLSafeLoader
+
 
 class MarkdownParser(DocumentParser):
     """
@@ -24,8 +31,11 @@ class MarkdownParser(DocumentParser):
     high performance for real-time indexing.
     """
     
+    # Frontmatter delimiters
+    FRONTMATTER_START = '---\n'
+    FRONTMATTER_END = '\n---\n'
+    
     # Regex patterns for Markdown parsing
-    FRONTMATTER_PATTERN = re.compile(r'^---\n(.*?)\n---\n', re.DOTALL | re.MULTILINE)
     HEADER_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
     LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
     IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
@@ -35,6 +45,20 @@ class MarkdownParser(DocumentParser):
     NUMBERED_LIST_PATTERN = re.compile(r'^[\s]*\d+\.\s+(.+)$', re.MULTILINE)
     BLOCKQUOTE_PATTERN = re.compile(r'^>\s+(.+)$', re.MULTILINE)
     TABLE_PATTERN = re.compile(r'^\|(.+)\|$', re.MULTILINE)
+    TABLE_SEPARATOR_PATTERN = re.compile(r'^\s*[-:]+\s*$', re.MULTILINE)
+    
+    # Emphasis markers, applied in order so bold is stripped before italic
+    EMPHASIS_PATTERNS = (
+        re.compile(r'\*\*([^*]+)\*\*'),  # Bold
+        re.compile(r'\*([^*]+)\*'),      # Italic
+        re.compile(r'__([^_]+)__'),      # Bold
+        re.compile(r'_([^_]+)_'),        # Italic
+        re.compile(r'~~([^~]+)~~'),      # Strikethrough
+    )
+    
+    # Anchor generation patterns
+    ANCHOR_INVALID_PATTERN = re.compile(r'[^\w\s-]')
+    ANCHOR_SEPARATOR_PATTERN = re.compile(r'[\s_-]+')
     
     def __init__(self, 
                  logger=None,
@@ -158,14 +182,25 @@ class MarkdownParser(DocumentParser):
         frontmatter_data = {}
         
         try:
-            match = self.FRONTMATTER_PATTERN.match(content)
-            if match:
-                yaml_content = match.group(1)
-                remaining_content = content[match.end():]
+            # Locate the delimiters by offset instead of matching the whole
+            # block with a regex
+            start = len(self.FRONTMATTER_START)
+            end = -1
+            if content.startswith(self.FRONTMATTER_START):
+                end = content.find(self.FRONTMATTER_END, start)
+                
+            if end != -1:
+                yaml_content = content[start:end]
+                remaining_content = content[end + len(self.FRONTMATTER_END):]
                 
                 # Parse YAML frontmatter
                 try:
-                    frontmatter_data = yaml.safe_load(yaml_content) or {}
+                    if self._may_contain_mapping(yaml_content):
+                        frontmatter_data = yaml.load(yaml_content, Loader=YAMLSafeLoader) or {}
+                    else:
+                        # Cannot load as a mapping, so skip the YAML loader;
+                        # a non-empty block is ignored like any other scalar
+                        frontmatter_data = None if yaml_content.strip() else {}
                     
                     # Ensure frontmatter is a dictionary
                     if not isinstance(frontmatter_data, dict):
@@ -194,6 +229,22 @@ class MarkdownParser(DocumentParser):
         
         return frontmatter_data, content
     
+    @staticmethod
+    def _may_contain_mapping(yaml_content: str) -> bool:
+        """
+        Cheaply check whether a YAML block could load as a mapping.
+        
+        Every mapping needs a ':' separator, a flow mapping brace or an
+        explicit '?' key, so a block with none of them is skipped.
+        
+        Args:
+            yaml_content: Raw frontmatter block
+            
+        Returns:
+            True if the block must be parsed to find out
+        """
+        return ':' in yaml_content or '{' in yaml_content or '?' in yaml_content
+    
     def _extract_structure(self, content: str) -> Dict[str, Any]:
         """
         Extract document structure (headers, lists, etc.).
@@ -209,15 +260,14 @@ class MarkdownParser(DocumentParser):
         try:
             # Extract headers
             headers = []
-            header_matches = self.HEADER_PATTERN.findall(content)
-            
-            for level_markers, header_text in header_matches:
-                level = len(level_markers)
-                headers.append({
-                    'level': level,
-                    'text': header_text.strip(),
-                    'anchor': self._generate_anchor(header_text.strip())
-                })
+            if '#' in content:
+                for match in self.HEADER_PATTERN.finditer(content):
+                    header_text = match.group(2).strip()
+                    headers.append({
+                        'level': len(match.group(1)),
+                        'text': header_text,
+                        'anchor': self._generate_anchor(header_text)
+                    })
             
             if headers:
                 structure_data['headers'] = headers
@@ -241,15 +291,15 @@ class MarkdownParser(DocumentParser):
                 structure_data['list_item_count'] = len(list_items)
             
             # Extract blockquotes
-            blockquotes = self.BLOCKQUOTE_PATTERN.findall(content)
+            blockquotes = self.BLOCKQUOTE_PATTERN.findall(content) if '>' in content else []
             if blockquotes:
                 structure_data['blockquotes'] = [quote.strip() for quote in blockquotes]
                 structure_data['blockquote_count'] = len(blockquotes)
             
-            # Extract tables
-            table_rows = self.TABLE_PATTERN.findall(content)
-            if table_rows:
-                structure_data['table_row_count'] = len(table_rows)
+            # Count table rows; only the count is kept, so no match list is built
+            table_row_count = sum(1 for _ in self.TABLE_PATTERN.finditer(content)) if '|' in content else 0
+            if table_row_count:
+                structure_data['table_row_count'] = table_row_count
                 structure_data['has_tables'] = True
             
         except Exception as e:
@@ -272,7 +322,7 @@ class MarkdownParser(DocumentParser):
         try:
             # Extract regular links
             links = []
-            link_matches = self.LINK_PATTERN.findall(content)
+            link_matches = self.LINK_PATTERN.findall(content) if '](' in content else []
             
             for link_text, link_url in link_matches:
                 links.append({
@@ -289,7 +339,7 @@ class MarkdownParser(DocumentParser):
             
             # Extract images
             images = []
-            image_matches = self.IMAGE_PATTERN.findall(content)
+            image_matches = self.IMAGE_PATTERN.findall(content) if '![' in content else []
             
             for alt_text, image_url in image_matches:
                 images.append({
@@ -322,7 +372,7 @@ class MarkdownParser(DocumentParser):
         try:
             # Extract code blocks
             code_blocks = []
-            code_matches = self.CODE_BLOCK_PATTERN.findall(content)
+            code_matches = self.CODE_BLOCK_PATTERN.findall(content) if '```' in content else []
             
             for language, code_content in code_matches:
                 code_blocks.append({
@@ -336,10 +386,10 @@ class MarkdownParser(DocumentParser):
                 metadata['code_block_count'] = len(code_blocks)
                 metadata['code_languages'] = list(set(block['language'] for block in code_blocks))
             
-            # Extract inline code
-            inline_code = self.INLINE_CODE_PATTERN.findall(content)
-            if inline_code:
-                metadata['inline_code_count'] = len(inline_code)
+            # Count inline code spans
+            inline_code_count = sum(1 for _ in self.INLINE_CODE_PATTERN.finditer(content)) if '`' in content else 0
+            if inline_code_count:
+                metadata['inline_code_count'] = inline_code_count
                 metadata['has_inline_code'] = True
             
             # Document statistics
@@ -380,42 +430,49 @@ class MarkdownParser(DocumentParser):
             Cleaned content suitable for indexing
         """
         try:
+            # Each markup pass is skipped when its delimiter never occurs;
+            # a substring check is much cheaper than a regex scan
+            cleaned = content
+            
             # Remove code blocks (preserve content but remove markup)
-            cleaned = self.CODE_BLOCK_PATTERN.sub(r'\2', content)
+            if '```' in cleaned:
+                cleaned = self.CODE_BLOCK_PATTERN.sub(r'\2', cleaned)
             
             # Remove inline code formatting
-            cleaned = self.INLINE_CODE_PATTERN.sub(r'\1', cleaned)
+            if '`' in cleaned:
+                cleaned = self.INLINE_CODE_PATTERN.sub(r'\1', cleaned)
             
             # Remove image syntax, keep alt text
-            cleaned = self.IMAGE_PATTERN.sub(r'\1', cleaned)
+            if '![' in cleaned:
+                cleaned = self.IMAGE_PATTERN.sub(r'\1', cleaned)
             
             # Remove link syntax, keep link text
-            cleaned = self.LINK_PATTERN.sub(r'\1', cleaned)
+            if '](' in cleaned:
+                cleaned = self.LINK_PATTERN.sub(r'\1', cleaned)
             
             # Remove header markers
-            cleaned = self.HEADER_PATTERN.sub(r'\2', cleaned)
+            if '#' in cleaned:
+                cleaned = self.HEADER_PATTERN.sub(r'\2', cleaned)
             
             # Remove blockquote markers
-            cleaned = self.BLOCKQUOTE_PATTERN.sub(r'\1', cleaned)
+            if '>' in cleaned:
+                cleaned = self.BLOCKQUOTE_PATTERN.sub(r'\1', cleaned)
             
             # Remove list markers
             cleaned = self.LIST_ITEM_PATTERN.sub(r'\1', cleaned)
             cleaned = self.NUMBERED_LIST_PATTERN.sub(r'\1', cleaned)
             
             # Remove table formatting
-            cleaned = re.sub(r'\|', ' ', cleaned)
-            cleaned = re.sub(r'^\s*[-:]+\s*$', '', cleaned, flags=re.MULTILINE)
+            cleaned = cleaned.replace('|', ' ')
+            cleaned = self.TABLE_SEPARATOR_PATTERN.sub('', cleaned)
             
             # Remove emphasis markers
-            cleaned = re.sub(r'\*\*([^*]+)\*\*', r'\1', cleaned)  # Bold
-            cleaned = re.sub(r'\*([^*]+)\*', r'\1', cleaned)      # Italic
-            cleaned = re.sub(r'__([^_]+)__', r'\1', cleaned)      # Bold
-            cleaned = re.sub(r'_([^_]+)_', r'\1', cleaned)        # Italic
-            cleaned = re.sub(r'~~([^~]+)~~', r'\1', cleaned)      # Strikethrough
+            for pattern in self.EMPHASIS_PATTERNS:
+                cleaned = pattern.sub(r'\1', cleaned)
             
             # Clean up whitespace
-            cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)  # Multiple newlines
-            cleaned = re.sub(r'[ \t]+', ' ', cleaned)     # Multiple spaces/tabs
+            cleaned = self.EXCESS_NEWLINES_PATTERN.sub('\n\n', cleaned)  # Multiple newlines
+            cleaned = self.INLINE_WHITESPACE_PATTERN.sub(' ', cleaned)  # Multiple spaces/tabs
             cleaned = cleaned.strip()
             
             return cleaned
@@ -436,31 +493,34 @@ class MarkdownParser(DocumentParser):
         """
         keywords = []
         
+        # Matches are consumed as they are found; none of the match lists
+        # are needed once their words have been harvested
         try:
             # Extract keywords from headers
-            header_matches = self.HEADER_PATTERN.findall(content)
-            for _, header_text in header_matches:
-                # Split header text into potential keywords
-                header_words = re.findall(r'\b[a-zA-Z0-9_]+\b', header_text.lower())
-                keywords.extend([
-                    word for word in header_words 
-                    if len(word) >= 3 and word not in self.STOP_WORDS
-                ])
+            if '#' in content:
+                for match in self.HEADER_PATTERN.finditer(content):
+                    # Split header text into potential keywords
+                    header_words = self.WORD_PATTERN.findall(match.group(2).lower())
+                    keywords.extend([
+                        word for word in header_words 
+                        if len(word) >= 3 and word not in self.STOP_WORDS
+                    ])
             
             # Extract keywords from link text
-            link_matches = self.LINK_PATTERN.findall(content)
-            for link_text, _ in link_matches:
-                link_words = re.findall(r'\b[a-zA-Z0-9_]+\b', link_text.lower())
-                keywords.extend([
-                    word for word in link_words 
-                    if len(word) >= 3 and word not in self.STOP_WORDS
-                ])
+            if '](' in content:
+                for match in self.LINK_PATTERN.finditer(content):
+                    link_words = self.WORD_PATTERN.findall(match.group(1).lower())
+                    keywords.extend([
+                        word for word in link_words 
+                        if len(word) >= 3 and word not in self.STOP_WORDS
+                    ])
             
             # Extract programming language keywords from code blocks
-            code_matches = self.CODE_BLOCK_PATTERN.findall(content)
-            for language, _ in code_matches:
-                if language and language.strip():
-                    keywords.append(language.strip().lower())
+            if '```' in content:
+                for match in self.CODE_BLOCK_PATTERN.finditer(content):
+                    language = match.group(1).strip()
+                    if language:
+                        keywords.append(language.lower())
             
         except Exception as e:
             self.logger.debug(f"Structure keyword extraction failed: {e}")
@@ -479,8 +539,8 @@ class MarkdownParser(DocumentParser):
         """
         # Convert to lowercase and replace spaces with hyphens
         anchor = header_text.lower()
-        anchor = re.sub(r'[^\w\s-]', '', anchor)  # Remove non-alphanumeric chars
-        anchor = re.sub(r'[\s_-]+', '-', anchor)  # Replace spaces/underscores with hyphens
+        anchor = self.ANCHOR_INVALID_PATTERN.sub('', anchor)  # Remove non-alphanumeric chars
+        anchor = self.ANCHOR_SEPARATOR_PATTERN.sub('-', anchor)  # Replace spaces/underscores with hyphens
         anchor = anchor.strip('-')  # Remove leading/trailing hyphens
         
         return anchor
\ No newline at end of file
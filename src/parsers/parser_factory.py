@@ -7,6 +7,10 @@ types and content analysis.
 """
 
 import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Type, Union
 
@@ -24,15 +28,26 @@ class ParserFactory:
     and error handling.
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    # Content at least this long is parsed in a worker process; below it,
+    # pickling the content and result costs more than parsing in-process
+    PROCESS_PARSE_MIN_CHARS = 64 * 1024
+    
+    def __init__(self,
+                 logger: Optional[logging.Logger] = None,
+                 max_workers: Optional[int] = None):
         """
         Initialize parser factory.
         
         Args:
             logger: Optional logger instance
+            max_workers: Worker processes for large content (defaults to CPU count)
         """
         self.logger = logger or logging.getLogger(__name__)
         
+        # Started on first use, so small-content workloads never fork
+        self._max_workers = max_workers
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        
         # Registry of available parsers
         self._parsers: Dict[str, Type[DocumentParser]] = {}
         self._parser_instances: Dict[str, DocumentParser] = {}
@@ -208,8 +223,15 @@ class ParserFactory:
             if parser_name in self._parser_usage_stats:
                 self._parser_usage_stats[parser_name] += 1
             
-            # Parse the file
-            result = await parser.parse_file(file_path)
+            # Parse the file; large files are parsed in worker processes.
+            # The size in bytes is at least the length in characters
+            executor = None
+            try:
+                if os.path.getsize(file_path) >= self.PROCESS_PARSE_MIN_CHARS:
+                    executor = self._get_process_pool()
+            except OSError:
+                pass  # The parser reports missing or unreadable files
+            result = await parser.parse_file(file_path, executor=executor)
             
             if not result.success:
                 self._failed_parses += 1
@@ -265,8 +287,12 @@ class ParserFactory:
             if content_type in self._parser_usage_stats:
                 self._parser_usage_stats[content_type] += 1
             
-            # Parse the content
-            result = await parser.parse_content(content, file_path)
+            # Parse the content; identical content is served from the parser's
+            # cache and large content is parsed in parallel worker processes
+            executor = None
+            if len(content) >= self.PROCESS_PARSE_MIN_CHARS:
+                executor = self._get_process_pool()
+            result = await parser.parse_content_cached(content, file_path, executor=executor)
             
             if not result.success:
                 self._failed_parses += 1
@@ -389,6 +415,23 @@ class ParserFactory:
             if hasattr(parser, 'reset_stats'):
                 parser.reset_stats()
     
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the worker pool for large content, starting it if needed."""
+        if self._process_pool is None:
+            # Spawned workers do not inherit the event loop or open
+            # database connections of this process
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._process_pool
+    
+    def shutdown(self) -> None:
+        """Stop the worker processes used for large content."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+    
     def clear_parser_cache(self) -> None:
         """Clear cached parser instances."""
         self._parser_instances.clear()
@@ -410,6 +453,7 @@ class ParserFactory:
 
 # Global factory instance for convenience
 _default_factory: Optional[ParserFactory] = None
+_default_factory_lock = threading.Lock()
 
 
 def get_default_factory(logger: Optional[logging.Logger] = None) -> ParserFactory:
@@ -422,17 +466,30 @@ def get_default_factory(logger: Optional[logging.Logger] = None) -> ParserFactor
     Returns:
         Default ParserFactory instance
     """
-    global _default_factory
+    # Reading the module global is atomic, so once the factory exists
+    # callers never touch the lock
+    factory = _default_factory
+    if factory is not None:
+        return factory
     
-    if _default_factory is None:
-        _default_factory = ParserFactory(logger=logger)
+    return _create_default_factory(logger)
+
+
+def _create_default_factory(logger: Optional[logging.Logger] = None) -> ParserFactory:
+    """Create the default factory once, even when threads race to it."""
+    global _default_factory
     
-    return _default_factory
+    with _default_factory_lock:
+        if _default_factory is None:
+            _default_factory = ParserFactory(logger=logger)
+        return _default_factory
 
 
 def reset_default_factory() -> None:
     """Reset the default factory instance (useful for testing)."""
     global _default_factory
+    if _default_factory is not None:
+        _default_factory.shutdown()
     _default_factory = None
 
 
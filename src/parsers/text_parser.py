@@ -7,6 +7,7 @@ optimized for various text file formats.
 """
 
 import re
+from collections import Counter
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 from pathlib import Path
@@ -42,6 +43,18 @@ class TextParser(DocumentParser):
     # Code-like patterns
     FUNCTION_PATTERN = re.compile(r'\b\w+\s*\([^)]*\)\s*{?', re.MULTILINE)
     VARIABLE_ASSIGNMENT_PATTERN = re.compile(r'^\s*\w+\s*=\s*.+$', re.MULTILINE)
+    COMMENT_PATTERNS = tuple(
+        re.compile(pattern, re.MULTILINE | re.DOTALL)
+        for pattern in (
+            r'//.*$',      # C-style comments
+            r'#.*$',       # Python/shell comments
+            r'/\*.*?\*/',  # Multi-line C comments
+            r'<!--.*?-->'  # HTML comments
+        )
+    )
+    
+    # Structure patterns
+    NUMBERED_LINE_PATTERN = re.compile(r'^\d+\.')
     
     def __init__(self, 
                  logger=None,
@@ -104,12 +117,15 @@ class TextParser(DocumentParser):
                 )
             
             # Basic text statistics
-            basic_stats = self._calculate_basic_stats(content)
+            # Split once; every line-based helper below shares the list
+            lines = content.split('\n')
+            
+            basic_stats = self._calculate_basic_stats(content, lines)
             result.metadata.update(basic_stats)
             
             # Detect document type
             if self.detect_document_type:
-                doc_type_info = self._detect_document_type(content, file_path)
+                doc_type_info = self._detect_document_type(content, file_path, lines)
                 result.metadata.update(doc_type_info)
             
             # Extract entities (emails, URLs, etc.)
@@ -119,7 +135,7 @@ class TextParser(DocumentParser):
             
             # Analyze document structure
             if self.analyze_structure:
-                structure_info = self._analyze_structure(content)
+                structure_info = self._analyze_structure(content, lines)
                 result.metadata.update(structure_info)
             
             # Extract type-specific metadata
@@ -165,17 +181,19 @@ class TextParser(DocumentParser):
                 error_message=error_msg
             )
     
-    def _calculate_basic_stats(self, content: str) -> Dict[str, Any]:
+    def _calculate_basic_stats(self, content: str, lines: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Calculate basic text statistics.
         
         Args:
             content: Text content to analyze
+            lines: Content already split on newlines, if available
             
         Returns:
             Dictionary containing basic statistics
         """
-        lines = content.split('\n')
+        if lines is None:
+            lines = content.split('\n')
         paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
         words = content.split()
         
@@ -200,13 +218,17 @@ class TextParser(DocumentParser):
             'text_type': 'text'
         }
     
-    def _detect_document_type(self, content: str, file_path: Optional[str] = None) -> Dict[str, Any]:
+    def _detect_document_type(self,
+                              content: str,
+                              file_path: Optional[str] = None,
+                              lines: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Detect the type of text document based on content and file path.
         
         Args:
             content: Text content to analyze
             file_path: Optional file path for hints
+            lines: Content already split on newlines, if available
             
         Returns:
             Dictionary containing document type information
@@ -215,9 +237,12 @@ class TextParser(DocumentParser):
         
         try:
             # Sample content for analysis (performance optimization)
-            lines = content.split('\n')
-            sample_lines = lines[:self.max_line_sample]
-            sample_content = '\n'.join(sample_lines)
+            if lines is None:
+                lines = content.split('\n')
+            if len(lines) > self.max_line_sample:
+                sample_content = '\n'.join(lines[:self.max_line_sample])
+            else:
+                sample_content = content
             
             # File extension hints
             if file_path:
@@ -257,7 +282,7 @@ class TextParser(DocumentParser):
             
             # Configuration file detection
             config_patterns = len(self.CONFIG_KEY_VALUE_PATTERN.findall(sample_content))
-            ini_sections = len(self.INI_SECTION_PATTERN.findall(sample_content))
+            ini_sections = len(self.INI_SECTION_PATTERN.findall(sample_content)) if '[' in sample_content else 0
             
             if config_patterns > 5 or ini_sections > 0:
                 if doc_info['document_type'] == 'text':  # Don't override file extension hints
@@ -295,15 +320,18 @@ class TextParser(DocumentParser):
         """
         entities = {}
         
+        # Each pattern below is only scanned when the content contains a
+        # literal every one of its matches needs; the substring checks are
+        # far cheaper than a regex pass that finds nothing
         try:
             # Extract emails
-            emails = self.EMAIL_PATTERN.findall(content)
+            emails = self.EMAIL_PATTERN.findall(content) if '@' in content else []
             if emails:
                 entities['emails'] = list(set(emails))  # Remove duplicates
                 entities['email_count'] = len(entities['emails'])
             
             # Extract URLs
-            urls = self.URL_PATTERN.findall(content)
+            urls = self.URL_PATTERN.findall(content) if '://' in content else []
             if urls:
                 entities['urls'] = list(set(urls))
                 entities['url_count'] = len(entities['urls'])
@@ -315,13 +343,13 @@ class TextParser(DocumentParser):
                 entities['phone_count'] = len(entities['phone_numbers'])
             
             # Extract dates
-            dates = self.DATE_PATTERN.findall(content)
+            dates = self.DATE_PATTERN.findall(content) if '-' in content or '/' in content else []
             if dates:
                 entities['dates'] = list(set(dates))
                 entities['date_count'] = len(entities['dates'])
             
             # Extract times
-            times = self.TIME_PATTERN.findall(content)
+            times = self.TIME_PATTERN.findall(content) if ':' in content else []
             if times:
                 entities['times'] = list(set(times))
                 entities['time_count'] = len(entities['times'])
@@ -331,12 +359,13 @@ class TextParser(DocumentParser):
         
         return entities
     
-    def _analyze_structure(self, content: str) -> Dict[str, Any]:
+    def _analyze_structure(self, content: str, lines: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Analyze document structure and patterns.
         
         Args:
             content: Text content to analyze
+            lines: Content already split on newlines, if available
             
         Returns:
             Dictionary containing structure analysis
@@ -344,7 +373,8 @@ class TextParser(DocumentParser):
         structure = {}
         
         try:
-            lines = content.split('\n')
+            if lines is None:
+                lines = content.split('\n')
             
             # Line length analysis
             line_lengths = [len(line) for line in lines]
@@ -375,7 +405,7 @@ class TextParser(DocumentParser):
                     elif line.strip().startswith(('-', '*', '+')):
                         prefixes['bullet'] = prefixes.get('bullet', 0) + 1
                     # Check for numbers
-                    elif re.match(r'^\d+\.', line.strip()):
+                    elif self.NUMBERED_LINE_PATTERN.match(line.strip()):
                         prefixes['numbered'] = prefixes.get('numbered', 0) + 1
             
             if prefixes:
@@ -417,25 +447,15 @@ class TextParser(DocumentParser):
         log_metadata = {}
         
         try:
-            lines = content.split('\n')
-            
-            # Count log levels
-            level_counts = {}
-            timestamps = []
-            
-            for line in lines:
-                # Extract log levels
-                level_matches = self.LOG_LEVEL_PATTERN.findall(line)
-                for level in level_matches:
-                    level_upper = level.upper()
-                    level_counts[level_upper] = level_counts.get(level_upper, 0) + 1
-                
-                # Extract timestamps
-                timestamp_matches = self.LOG_TIMESTAMP_PATTERN.findall(line)
-                timestamps.extend(timestamp_matches)
+            # Count log levels and collect timestamps with one scan of the
+            # whole content each, rather than a Python loop over lines
+            level_counts = Counter(
+                level.upper() for level in self.LOG_LEVEL_PATTERN.findall(content)
+            )
+            timestamps = self.LOG_TIMESTAMP_PATTERN.findall(content)
             
             if level_counts:
-                log_metadata['log_levels'] = level_counts
+                log_metadata['log_levels'] = dict(level_counts)
                 log_metadata['total_log_entries'] = sum(level_counts.values())
                 
                 # Determine log severity distribution
@@ -477,7 +497,7 @@ class TextParser(DocumentParser):
                 config_metadata['config_key_count'] = len(kv_pairs)
             
             # Extract INI sections
-            sections = self.INI_SECTION_PATTERN.findall(content)
+            sections = self.INI_SECTION_PATTERN.findall(content) if '[' in content else []
             if sections:
                 config_metadata['ini_sections'] = sections
                 config_metadata['ini_section_count'] = len(sections)
@@ -521,16 +541,9 @@ class TextParser(DocumentParser):
                 code_metadata['variable_assignment_count'] = len(variables)
             
             # Count comments (basic detection)
-            comment_patterns = [
-                r'//.*$',      # C-style comments
-                r'#.*$',       # Python/shell comments
-                r'/\*.*?\*/',  # Multi-line C comments
-                r'<!--.*?-->'  # HTML comments
-            ]
-            
             total_comments = 0
-            for pattern in comment_patterns:
-                total_comments += len(re.findall(pattern, content, re.MULTILINE | re.DOTALL))
+            for pattern in self.COMMENT_PATTERNS:
+                total_comments += len(pattern.findall(content))
             
             if total_comments > 0:
                 code_metadata['comment_count'] = total_comments
@@ -553,8 +566,8 @@ class TextParser(DocumentParser):
         try:
             # For plain text, minimal cleaning is needed
             # Remove excessive whitespace
-            cleaned = re.sub(r'\n{3,}', '\n\n', content)  # Multiple newlines
-            cleaned = re.sub(r'[ \t]+', ' ', cleaned)     # Multiple spaces/tabs
+            cleaned = self.EXCESS_NEWLINES_PATTERN.sub('\n\n', content)  # Multiple newlines
+            cleaned = self.INLINE_WHITESPACE_PATTERN.sub(' ', cleaned)  # Multiple spaces/tabs
             cleaned = cleaned.strip()
             
             return cleaned
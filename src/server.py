@@ -60,8 +60,10 @@ class MyDocsMCPServer:
         # Register server handlers
         self._register_handlers()
         
-        # Flag to track tool registration
+        # Flag to track tool registration; the lock keeps concurrent first
+        # requests from registering the tools more than once
         self._tools_registered = False
+        self._tools_lock = asyncio.Lock()
         
         # File system watcher (initialized later)
         self.file_watcher: Optional[FileWatcher] = None
@@ -94,31 +96,35 @@ class MyDocsMCPServer:
         if self._tools_registered:
             return True
         
-        try:
-            self.logger.info("Initializing mydocs-mcp tools")
-            
-            # Get database path from configuration
-            database_path = str(self.config.get_database_path())
-            
-            # Register core tools
-            success = await register_core_tools(
-                tool_registry=self.tool_registry,
-                database_path=database_path,
-                logger=self.logger
-            )
-            
-            if success:
-                self._tools_registered = True
-                tool_count = len(self.tool_registry.get_tool_names())
-                self.logger.info(f"Successfully initialized {tool_count} tools")
-            else:
-                self.logger.error("Failed to initialize tools")
-            
-            return success
+        async with self._tools_lock:
+            if self._tools_registered:
+                return True
             
-        except Exception as e:
-            self.logger.error(f"Tool initialization failed: {e}", exc_info=True)
-            return False
+            try:
+                self.logger.info("Initializing mydocs-mcp tools")
+                
+                # Get database path from configuration
+                database_path = str(self.config.get_database_path())
+                
+                # Register core tools
+                success = await register_core_tools(
+                    tool_registry=self.tool_registry,
+                    database_path=database_path,
+                    logger=self.logger
+                )
+                
+                if success:
+                    self._tools_registered = True
+                    tool_count = len(self.tool_registry.get_tool_names())
+                    self.logger.info(f"Successfully initialized {tool_count} tools")
+                else:
+                    self.logger.error("Failed to initialize tools")
+                
+                return success
+                
+            except Exception as e:
+                self.logger.error(f"Tool initialization failed: {e}", exc_info=True)
+                return False
     
     async def _initialize_watcher(self) -> bool:
         """Initialize and start the file system watcher."""
@@ -171,7 +177,7 @@ class MyDocsMCPServer:
             tools = self.tool_registry.get_available_tools()
             
             self.logger.debug(f"Found {len(tools)} available tools")
-            return ListToolsResult(tools=tools)
+            return ListToolsResult(tools=list(tools))
             
         except Exception as e:
             self.logger.error(f"Error in list_tools handler: {e}")
@@ -377,9 +383,10 @@ class MyDocsMCPServer:
             self.logger.error(f"Error stopping file watcher: {e}")
         
         try:
-            # Cleanup tool registry resources
+            # Cleanup tool registry resources, including the database
             if hasattr(self.tool_registry, 'cleanup'):
                 await self.tool_registry.cleanup()
+                self._tools_registered = False
         except Exception as e:
             self.logger.error(f"Error cleaning up tool registry: {e}")
         
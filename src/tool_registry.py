@@ -7,8 +7,9 @@ with proper error handling and validation.
 """
 
 import asyncio
+import functools
 import inspect
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from mcp.types import Tool
 from pydantic import BaseModel
@@ -48,12 +49,29 @@ class ToolRegistry:
     
     The registry maintains a collection of available tools, their metadata,
     and provides methods for tool discovery and execution.
+    
+    Each tool's argument validation and invocation is compiled into a single
+    callable when it is registered, so executing a tool is one dispatch
+    table lookup and a direct call.
     """
     
+    # JSON schema types checked during argument validation
+    TYPE_MAPPING: Dict[str, Union[type, Tuple[type, ...]]] = {
+        "string": str,
+        "number": (int, float),
+        "integer": int,
+        "boolean": bool,
+        "array": list,
+        "object": dict,
+    }
+    
     def __init__(self):
         """Initialize the tool registry."""
         self.logger = get_logger(__name__)
         self._tools: Dict[str, ToolMetadata] = {}
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]] = {}
+        self._tools_snapshot: Optional[Tuple[Tool, ...]] = None
+        self._cleanup_callbacks: List[Callable[[], Awaitable[Any]]] = []
         self.logger.info("Tool registry initialized")
     
     def register_tool(
@@ -107,6 +125,8 @@ class ToolRegistry:
             )
             
             self._tools[name] = metadata
+            self._dispatch[name] = self._build_dispatch(metadata)
+            self._tools_snapshot = None
             
             self.logger.info(f"Tool '{name}' registered successfully")
             self.logger.debug(f"Tool metadata: {metadata}")
@@ -128,12 +148,26 @@ class ToolRegistry:
         """
         if name in self._tools:
             del self._tools[name]
+            del self._dispatch[name]
+            self._tools_snapshot = None
             self.logger.info(f"Tool '{name}' unregistered")
             return True
         else:
             self.logger.warning(f"Attempted to unregister unknown tool '{name}'")
             return False
     
+    def add_cleanup_callback(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Register a coroutine function to run when the registry is cleaned up.
+        
+        Used for resources shared by registered tools, such as the
+        document manager and its database connection.
+        
+        Args:
+            callback: Coroutine function taking no arguments
+        """
+        self._cleanup_callbacks.append(callback)
+    
     def has_tool(self, name: str) -> bool:
         """Check if a tool is registered."""
         return name in self._tools
@@ -155,82 +189,103 @@ class ToolRegistry:
         """Get list of registered tool names."""
         return list(self._tools.keys())
     
-    def get_available_tools(self) -> List[Tool]:
+    def get_available_tools(self) -> Tuple[Tool, ...]:
         """
-        Get list of available tools in MCP format.
+        Get available tools in MCP format.
+        
+        The Tool definitions are built once and the same immutable snapshot
+        is returned until a tool is registered or unregistered.
         
         Returns:
-            List of Tool objects for MCP protocol
+            Tuple of Tool objects for MCP protocol
         """
-        tools = []
-        
-        for metadata in self._tools.values():
-            tool = Tool(
-                name=metadata.name,
-                description=metadata.description,
-                inputSchema=metadata.input_schema
+        if self._tools_snapshot is None:
+            self._tools_snapshot = tuple(
+                Tool(
+                    name=metadata.name,
+                    description=metadata.description,
+                    inputSchema=metadata.input_schema
+                )
+                for metadata in self._tools.values()
             )
-            tools.append(tool)
+            self.logger.debug(f"Generated {len(self._tools_snapshot)} tool definitions")
         
-        self.logger.debug(f"Generated {len(tools)} tool definitions")
-        return tools
+        return self._tools_snapshot
     
-    def _validate_arguments(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    def _compile_validator(
+        self,
+        input_schema: Dict[str, Any]
+    ) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
         """
-        Validate tool arguments against input schema.
+        Compile an input schema into an argument validator.
+        
+        Required fields and property types are resolved once, so validating
+        a call does not walk the schema again.
         
         Args:
-            tool_name: Name of the tool
-            arguments: Arguments to validate
+            input_schema: JSON schema for tool input validation
         
         Returns:
-            Validated arguments
-        
-        Raises:
-            ValidationError: If arguments are invalid
+            Function that validates and returns tool arguments
         """
-        metadata = self._tools[tool_name]
-        schema = metadata.input_schema
+        required_fields = tuple(input_schema.get("required", ()))
+        
+        # Properties with a known type; unknown types are not validated
+        typed_properties = {
+            arg_name: (prop_schema["type"], self.TYPE_MAPPING[prop_schema["type"]])
+            for arg_name, prop_schema in input_schema.get("properties", {}).items()
+            if prop_schema.get("type") in self.TYPE_MAPPING
+        }
         
-        # Basic validation - check required fields
-        if "required" in schema:
-            required_fields = schema["required"]
+        def validate(arguments: Dict[str, Any]) -> Dict[str, Any]:
             for field in required_fields:
                 if field not in arguments:
                     raise ValidationError(f"Missing required argument: {field}")
-        
-        # Type validation for properties (basic implementation)
-        if "properties" in schema:
-            properties = schema["properties"]
+                    
             for arg_name, arg_value in arguments.items():
-                if arg_name in properties:
-                    prop_schema = properties[arg_name]
-                    if "type" in prop_schema:
-                        expected_type = prop_schema["type"]
-                        if not self._validate_type(arg_value, expected_type):
-                            raise ValidationError(
-                                f"Argument '{arg_name}' must be of type {expected_type}, "
-                                f"got {type(arg_value).__name__}"
-                            )
-        
-        return arguments
+                expected = typed_properties.get(arg_name)
+                if expected and not isinstance(arg_value, expected[1]):
+                    raise ValidationError(
+                        f"Argument '{arg_name}' must be of type {expected[0]}, "
+                        f"got {type(arg_value).__name__}"
+                    )
+                    
+            return arguments
+            
+        return validate
     
-    def _validate_type(self, value: Any, expected_type: str) -> bool:
-        """Validate value type against expected JSON schema type."""
-        type_mapping = {
-            "string": str,
-            "number": (int, float),
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
+    def _build_dispatch(self, metadata: ToolMetadata) -> Callable[[Dict[str, Any]], Awaitable[Any]]:
+        """
+        Build the callable that validates arguments and invokes a tool.
         
-        if expected_type not in type_mapping:
-            return True  # Unknown type, skip validation
+        Args:
+            metadata: Metadata of the registered tool
+        
+        Returns:
+            Coroutine function taking the tool arguments
+        """
+        validate = self._compile_validator(metadata.input_schema)
+        handler = metadata.handler
+        timeout = metadata.timeout
         
-        expected_python_type = type_mapping[expected_type]
-        return isinstance(value, expected_python_type)
+        if metadata.is_async:
+            async def dispatch(arguments: Dict[str, Any]) -> Any:
+                call = handler(**validate(arguments))
+                if timeout:
+                    return await asyncio.wait_for(call, timeout=timeout)
+                return await call
+        else:
+            async def dispatch(arguments: Dict[str, Any]) -> Any:
+                # Run sync function in thread pool to avoid blocking
+                loop = asyncio.get_running_loop()
+                call = loop.run_in_executor(
+                    None, functools.partial(handler, **validate(arguments))
+                )
+                if timeout:
+                    return await asyncio.wait_for(call, timeout=timeout)
+                return await call
+                
+        return dispatch
     
     async def execute_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -246,37 +301,16 @@ class ToolRegistry:
         Raises:
             ToolExecutionError: If tool execution fails
         """
-        if name not in self._tools:
+        dispatch = self._dispatch.get(name)
+        if dispatch is None:
             raise ToolExecutionError(f"Tool '{name}' not found")
         
-        metadata = self._tools[name]
         arguments = arguments or {}
         
         self.logger.debug(f"Executing tool '{name}' with arguments: {arguments}")
         
         try:
-            # Validate arguments
-            validated_args = self._validate_arguments(name, arguments)
-            
-            # Execute tool with timeout
-            if metadata.is_async:
-                if metadata.timeout:
-                    result = await asyncio.wait_for(
-                        metadata.handler(**validated_args),
-                        timeout=metadata.timeout
-                    )
-                else:
-                    result = await metadata.handler(**validated_args)
-            else:
-                # Run sync function in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                if metadata.timeout:
-                    result = await asyncio.wait_for(
-                        loop.run_in_executor(None, metadata.handler, **validated_args),
-                        timeout=metadata.timeout
-                    )
-                else:
-                    result = await loop.run_in_executor(None, metadata.handler, **validated_args)
+            result = await dispatch(arguments)
             
             self.logger.debug(f"Tool '{name}' executed successfully")
             return result
@@ -287,7 +321,7 @@ class ToolRegistry:
             raise ToolExecutionError(error_msg) from e
         
         except asyncio.TimeoutError:
-            error_msg = f"Tool '{name}' timed out after {metadata.timeout}s"
+            error_msg = f"Tool '{name}' timed out after {self._tools[name].timeout}s"
             self.logger.error(error_msg)
             raise ToolExecutionError(error_msg)
         
@@ -324,7 +358,17 @@ class ToolRegistry:
         
         # Clear all registered tools
         self._tools.clear()
+        self._dispatch.clear()
+        self._tools_snapshot = None
         
+        # Release resources shared by the tools
+        callbacks, self._cleanup_callbacks = self._cleanup_callbacks, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                self.logger.error(f"Tool registry cleanup callback failed: {e}")
+                
         self.logger.info("Tool registry cleanup completed")
     
     def __len__(self) -> int:
@@ -7,12 +7,14 @@ can access for document intelligence operations.
 
 Core Tools:
 - indexDocument: Index documents for search and retrieval
+- indexDocuments: Index several documents in batched transactions
 - searchDocuments: Search through indexed documents
 - getDocument: Retrieve document content and metadata
 """
 
 from .base import BaseMCPTool, ToolResult, MCPToolError
 from .indexDocument import IndexDocumentTool
+from .indexDocuments import IndexDocumentsTool
 from .searchDocuments import SearchDocumentsTool
 from .getDocument import GetDocumentTool
 
@@ -21,6 +23,7 @@ __all__ = [
     'ToolResult', 
     'MCPToolError',
     'IndexDocumentTool',
+    'IndexDocumentsTool',
     'SearchDocumentsTool',
     'GetDocumentTool'
 ]
\ No newline at end of file
@@ -8,9 +8,11 @@ document queries layer and provides sub-200ms response times for typical retriev
 """
 
 import json
+import os
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime
 
 from .base import BaseMCPTool, ToolResult, ToolExecutionError
@@ -32,13 +34,23 @@ class GetDocumentTool(BaseMCPTool):
     - Sub-200ms response time for typical document retrieval
     - Support for documents up to 10MB with content management
     - Efficient metadata and content formatting
+    
+    Documents looked up by path are kept in an LRU cache keyed by
+    (file_path, st_mtime_ns, index generation), so repeated retrievals of an
+    unchanged file skip the database. Editing the file changes its key, and
+    any index or delete through the DocumentManager bumps the generation.
+    Rows older than the file on disk are never cached.
     """
     
+    DOCUMENT_CACHE_SIZE = 256
+    
     def __init__(self, *args, **kwargs):
         """Initialize getDocument tool with format options."""
         super().__init__(*args, **kwargs)
         self.max_content_size = 5 * 1024 * 1024  # 5MB max content size for performance
         self.truncation_indicator = "\n\n[Content truncated due to size limits]\n"
+        self._doc_cache: "OrderedDict[Tuple[str, int, Any], Document]" = OrderedDict()
+        self._doc_cache_generation: Any = None
     
     def get_tool_name(self) -> str:
         """Return the MCP tool name."""
@@ -145,14 +157,21 @@ class GetDocumentTool(BaseMCPTool):
                     )
             
             elif file_path:
-                document = await self.database_manager.doc_queries.get_document_by_path(file_path)
                 retrieval_method = "by_path"
+                cache_key = self._document_cache_key(file_path)
+                document = self._get_cached_document(cache_key)
                 
                 if not document:
-                    return ToolResult.error_result(
-                        f"Document with path '{file_path}' not found",
-                        metadata={"file_path": file_path, "retrieval_method": retrieval_method}
-                    )
+                    document = await self.database_manager.doc_queries.get_document_by_path(file_path)
+                    
+                    if not document:
+                        return ToolResult.error_result(
+                            f"Document with path '{file_path}' not found",
+                            metadata={"file_path": file_path, "retrieval_method": retrieval_method}
+                        )
+                        
+                    if self._is_current(document, cache_key):
+                        self._cache_document(cache_key, document)
             
             # Prepare response data
             response_data = await self._format_document_response(
@@ -204,6 +223,57 @@ class GetDocumentTool(BaseMCPTool):
                 metadata=error_metadata
             )
     
+    def _document_cache_key(self, file_path: str) -> Optional[Tuple[str, int, Any]]:
+        """
+        Build the document cache key for a file path.
+        
+        The index generation is read before the database lookup, so a row
+        fetched while a reindex is in flight is filed under the old
+        generation and never served afterwards.
+        
+        Args:
+            file_path: Path of the document file
+            
+        Returns:
+            (file_path, st_mtime_ns, index generation) tuple, or None if the
+            file cannot be stat'ed
+        """
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+            
+        generation = getattr(self.database_manager, "index_generation", None)
+        if generation != self._doc_cache_generation:
+            # Documents changed since the entries were cached
+            self._doc_cache.clear()
+            self._doc_cache_generation = generation
+            
+        return file_path, mtime_ns, generation
+    
+    def _is_current(self, document: Document, cache_key: Optional[Tuple[str, int, Any]]) -> bool:
+        """Check that a stored document was indexed after the file was last modified."""
+        if cache_key is None or document.modified_at is None:
+            return False
+        return document.modified_at >= datetime.fromtimestamp(cache_key[1] / 1e9)
+    
+    def _get_cached_document(self, cache_key: Optional[Tuple[str, int, Any]]) -> Optional[Document]:
+        """Return the cached document for a key and mark it most recently used."""
+        if cache_key is None:
+            return None
+            
+        document = self._doc_cache.get(cache_key)
+        if document is not None:
+            self._doc_cache.move_to_end(cache_key)
+        return document
+    
+    def _cache_document(self, cache_key: Tuple[str, int, Any], document: Document) -> None:
+        """Cache a document, evicting the least recently used entry when full."""
+        self._doc_cache[cache_key] = document
+        self._doc_cache.move_to_end(cache_key)
+        if len(self._doc_cache) > self.DOCUMENT_CACHE_SIZE:
+            self._doc_cache.popitem(last=False)
+    
     async def _format_document_response(
         self,
         document: Document,
@@ -35,6 +35,8 @@ class IndexDocumentTool(BaseMCPTool):
     - Performance monitoring
     """
     
+    MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB limit
+    
     def get_tool_name(self) -> str:
         """Return the MCP tool name."""
         return "indexDocument"
@@ -82,72 +84,29 @@ class IndexDocumentTool(BaseMCPTool):
         force_reindex = validated_params.get("force_reindex", False)
         
         try:
-            # Validate file exists and is readable
-            path_obj = Path(file_path)
-            if not path_obj.exists():
-                return ToolResult.error_result(
-                    f"File not found: {file_path}"
-                )
-            
-            if not path_obj.is_file():
-                return ToolResult.error_result(
-                    f"Path is not a file: {file_path}"
-                )
+            prepared = await self._prepare_document(file_path, force_reindex)
             
-            # Check file extension
-            if not self._is_supported_file_type(file_path):
-                return ToolResult.error_result(
-                    f"Unsupported file type: {path_obj.suffix}. "
-                    f"Supported types: .md, .txt"
-                )
+            if prepared["status"] == "error":
+                return ToolResult.error_result(prepared["error"])
             
-            # Check file size (limit to reasonable size for MVP)
-            file_size = path_obj.stat().st_size
-            max_file_size = 10 * 1024 * 1024  # 10MB limit
-            if file_size > max_file_size:
-                return ToolResult.error_result(
-                    f"File too large: {file_size} bytes. Maximum size: {max_file_size} bytes"
-                )
-            
-            # Check if already indexed
-            existing_doc = await self.database_manager.doc_queries.get_document_by_path(file_path)
-            
-            if existing_doc and not force_reindex:
-                # Check if file has been modified since last indexing
-                file_mtime = datetime.fromtimestamp(path_obj.stat().st_mtime)
-                if file_mtime <= existing_doc.modified_at:
-                    return ToolResult.success_result({
-                        "status": "already_indexed",
-                        "document_id": existing_doc.id,
-                        "message": "Document is already indexed and up to date",
-                        "indexed_at": existing_doc.indexed_at.isoformat() if existing_doc.indexed_at else None,
-                        "file_path": file_path
-                    })
-            
-            # Parse the document
-            parse_result = await self.parser_factory.parse_file(file_path)
-            
-            if not parse_result.success:
-                return ToolResult.error_result(
-                    f"Failed to parse document: {parse_result.error_message}"
-                )
-            
-            # Prepare content and metadata
-            content = parse_result.content or ""
-            if not content.strip():
-                return ToolResult.error_result(
-                    "Document appears to be empty or contains no readable content"
-                )
-            
-            # Combine metadata from parsing and file system
-            combined_metadata = self._combine_metadata(parse_result, path_obj)
+            if prepared["status"] == "already_indexed":
+                return ToolResult.success_result({
+                    "status": "already_indexed",
+                    "document_id": prepared["document_id"],
+                    "message": prepared["message"],
+                    "indexed_at": prepared["indexed_at"],
+                    "file_path": file_path
+                })
+                
+            parse_result = prepared["parse_result"]
+            content = prepared["content"]
+            combined_metadata = prepared["metadata"]
             
             # Index the document
             document_id = await self.database_manager.index_document(
                 file_path=file_path,
                 content=content,
-                metadata=combined_metadata,
-                extract_keywords=True
+                metadata=combined_metadata
             )
             
             if document_id is None:
@@ -157,10 +116,10 @@ class IndexDocumentTool(BaseMCPTool):
             
             # Prepare success response
             response_data = {
-                "status": "indexed" if not existing_doc else "reindexed",
+                "status": prepared["status"],
                 "document_id": document_id,
                 "file_path": file_path,
-                "file_size_bytes": file_size,
+                "file_size_bytes": prepared["file_size"],
                 "content_length": len(content),
                 "indexed_at": datetime.now().isoformat(),
                 "metadata_fields_extracted": len(combined_metadata),
@@ -186,6 +145,126 @@ class IndexDocumentTool(BaseMCPTool):
                 f"Tool execution failed: {str(e)}"
             )
     
+    async def _prepare_document(self, file_path: str, force_reindex: bool) -> Dict[str, Any]:
+        """
+        Validate and parse a file, skipping documents that are up to date.
+        
+        Shared by indexDocument and indexDocuments; only the database write
+        differs between them.
+        
+        Args:
+            file_path: Path to the document file
+            force_reindex: Whether to reindex up-to-date documents
+            
+        Returns:
+            Dictionary whose "status" is "error" (with "error"),
+            "already_indexed" (with "document_id", "message" and
+            "indexed_at"), or "indexed"/"reindexed" (with "parse_result",
+            "content", "metadata" and "file_size")
+        """
+        # Validate file exists, is supported and within size limits
+        error = self._validate_file(file_path)
+        if error:
+            return {"status": "error", "error": error}
+            
+        path_obj = Path(file_path)
+        file_stat = path_obj.stat()
+        
+        # Check if already indexed and unmodified since last indexing
+        existing_doc = await self.database_manager.doc_queries.get_document_by_path(file_path)
+        
+        if existing_doc and not force_reindex:
+            file_mtime = datetime.fromtimestamp(file_stat.st_mtime)
+            if file_mtime <= existing_doc.modified_at:
+                return {
+                    "status": "already_indexed",
+                    "document_id": existing_doc.id,
+                    "message": "Document is already indexed and up to date",
+                    "indexed_at": existing_doc.indexed_at.isoformat() if existing_doc.indexed_at else None
+                }
+                
+        # Parse the document
+        parse_result = await self.parser_factory.parse_file(file_path)
+        
+        if not parse_result.success:
+            return {
+                "status": "error",
+                "error": f"Failed to parse document: {parse_result.error_message}"
+            }
+            
+        content = parse_result.content or ""
+        if not content.strip():
+            return {
+                "status": "error",
+                "error": "Document appears to be empty or contains no readable content"
+            }
+            
+        # A touched but unchanged file needs no re-tokenizing; only move
+        # its timestamps so the modification time check matches next time
+        if existing_doc and not force_reindex and self._content_unchanged(existing_doc, content):
+            indexed_at = await self.database_manager.touch_document(existing_doc.id)
+            indexed_at = indexed_at or existing_doc.indexed_at
+            return {
+                "status": "already_indexed",
+                "document_id": existing_doc.id,
+                "message": "Document content is unchanged since last indexing",
+                "indexed_at": indexed_at.isoformat() if indexed_at else None
+            }
+            
+        return {
+            "status": "reindexed" if existing_doc else "indexed",
+            "parse_result": parse_result,
+            "content": content,
+            # Combine metadata from parsing and file system
+            "metadata": self._combine_metadata(parse_result, path_obj),
+            "file_size": file_stat.st_size
+        }
+    
+    def _validate_file(self, file_path: str) -> Optional[str]:
+        """
+        Check that a file can be indexed.
+        
+        Args:
+            file_path: Path to file to check
+            
+        Returns:
+            Error message if the file cannot be indexed, None otherwise
+        """
+        path_obj = Path(file_path)
+        if not path_obj.exists():
+            return f"File not found: {file_path}"
+            
+        if not path_obj.is_file():
+            return f"Path is not a file: {file_path}"
+            
+        # Check file extension
+        if not self._is_supported_file_type(file_path):
+            return (
+                f"Unsupported file type: {path_obj.suffix}. "
+                f"Supported types: .md, .txt"
+            )
+            
+        # Check file size (limit to reasonable size for MVP)
+        file_size = path_obj.stat().st_size
+        if file_size > self.MAX_FILE_SIZE:
+            return f"File too large: {file_size} bytes. Maximum size: {self.MAX_FILE_SIZE} bytes"
+            
+        return None
+    
+    def _content_unchanged(self, existing_doc, content: str) -> bool:
+        """
+        Check whether parsed content matches the stored document.
+        
+        Args:
+            existing_doc: Document already stored for the file path
+            content: Freshly parsed document content
+            
+        Returns:
+            True if the content hash equals the stored file hash
+        """
+        # Same SHA-256 digest Document stores in file_hash
+        return existing_doc.file_hash == hashlib.sha256(content.encode('utf-8')).hexdigest()
+    
     def _is_supported_file_type(self, file_path: str) -> bool:
         """
         Check if file type is supported for indexing.
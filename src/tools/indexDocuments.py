@@ -0,0 +1,174 @@
+"""
+indexDocuments MCP Tool Implementation
+
+This module implements the indexDocuments tool for mydocs-mcp, the batch
+counterpart of indexDocument. All files are parsed first and then written
+to the database in batches, one transaction per batch, instead of paying a
+round-trip and commit per file.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from .base import ToolResult
+from .indexDocument import IndexDocumentTool
+
+
+class IndexDocumentsTool(IndexDocumentTool):
+    """
+    MCP Tool for indexing several documents in one call.
+    
+    Shares file validation, up-to-date checks, parsing and metadata
+    extraction with IndexDocumentTool.
+    Files are validated and parsed concurrently, at most MAX_CONCURRENT_FILES
+    at a time. Files that fail validation or parsing are reported per path
+    without aborting the rest of the batch.
+    """
+    
+    DEFAULT_BATCH_SIZE = 100
+    MAX_CONCURRENT_FILES = 8
+    
+    def get_tool_name(self) -> str:
+        """Return the MCP tool name."""
+        return "indexDocuments"
+    
+    def get_tool_description(self) -> str:
+        """Return the MCP tool description."""
+        return (
+            "Index multiple document files (.md or .txt) for search and retrieval. "
+            "Parses every file, then stores them in the document database using "
+            "one transaction per batch."
+        )
+    
+    def get_parameter_schema(self) -> Dict[str, Any]:
+        """Return the JSON schema for tool parameters."""
+        return {
+            "type": "object",
+            "properties": {
+                "file_paths": {
+                    "type": "array",
+                    "items": {
+                        "type": "string",
+                        "minLength": 1,
+                        "maxLength": 1000
+                    },
+                    "description": "Full paths to the document files to index",
+                    "minItems": 1,
+                    "maxItems": 1000
+                },
+                "force_reindex": {
+                    "type": "boolean",
+                    "description": "Force reindexing even if documents are already indexed and up to date",
+                    "default": False
+                },
+                "batch_size": {
+                    "type": "integer",
+                    "description": "Maximum number of documents written per transaction",
+                    "minimum": 1,
+                    "maximum": 1000,
+                    "default": self.DEFAULT_BATCH_SIZE
+                }
+            },
+            "required": ["file_paths"],
+            "additionalProperties": False
+        }
+    
+    async def _execute_tool(self, validated_params: Dict[str, Any]) -> ToolResult:
+        """
+        Execute the indexDocuments tool.
+        
+        Args:
+            validated_params: Validated tool parameters
+            
+        Returns:
+            ToolResult with per-file indexing results
+        """
+        file_paths = validated_params["file_paths"]
+        force_reindex = validated_params.get("force_reindex", False)
+        batch_size = validated_params.get("batch_size", self.DEFAULT_BATCH_SIZE)
+        
+        try:
+            # Validate and parse files concurrently; each file is independent
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FILES)
+            
+            async def prepare(file_path: str):
+                async with semaphore:
+                    return await self._prepare_file(file_path, force_reindex)
+            
+            prepared = await asyncio.gather(*(prepare(path) for path in file_paths))
+            
+            results: Dict[str, Dict[str, Any]] = {}
+            to_index = []
+            for file_path, (result, entry) in zip(file_paths, prepared):
+                results[file_path] = result
+                if entry is not None:
+                    to_index.append(entry)
+            
+            # Write all parsed documents in batched transactions
+            if to_index:
+                document_ids = await self.database_manager.index_documents(
+                    to_index,
+                    batch_size=batch_size
+                )
+                
+                for file_path, _, _ in to_index:
+                    document_id = document_ids.get(file_path)
+                    if document_id is None:
+                        results[file_path] = {
+                            "status": "error",
+                            "error": "Failed to index document in database"
+                        }
+                    else:
+                        results[file_path]["document_id"] = document_id
+                        
+            failed = sum(1 for result in results.values() if result["status"] == "error")
+            skipped = sum(1 for result in results.values() if result["status"] == "already_indexed")
+            
+            return ToolResult.success_result(
+                data={
+                    "indexed_count": len(results) - failed - skipped,
+                    "skipped_count": skipped,
+                    "failed_count": failed,
+                    "indexed_at": datetime.now().isoformat(),
+                    "results": results
+                },
+                metadata={
+                    "tool_version": "1.0",
+                    "batch_size": batch_size,
+                    "force_reindex": force_reindex
+                }
+            )
+            
+        except Exception as e:
+            self.logger.error(f"indexDocuments tool execution failed: {e}", exc_info=True)
+            return ToolResult.error_result(
+                f"Tool execution failed: {str(e)}"
+            )
+    
+    async def _prepare_file(
+        self,
+        file_path: str,
+        force_reindex: bool
+    ) -> Tuple[Dict[str, Any], Optional[Tuple[str, str, Dict[str, str]]]]:
+        """
+        Validate and parse a single file ahead of the batched write.
+        
+        Args:
+            file_path: Path to the document file
+            force_reindex: Whether to reindex up-to-date documents
+            
+        Returns:
+            Tuple of the per-file result and the (file_path, content, metadata)
+            entry to index, or None if the file is skipped
+        """
+        prepared = await self._prepare_document(file_path, force_reindex)
+        
+        if prepared["status"] == "error":
+            return {"status": "error", "error": prepared["error"]}, None
+        
+        if prepared["status"] == "already_indexed":
+            return {"status": "already_indexed", "document_id": prepared["document_id"]}, None
+        
+        entry = (file_path, prepared["content"], prepared["metadata"])
+        return {"status": prepared["status"]}, entry
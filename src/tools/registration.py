@@ -5,11 +5,13 @@ This module provides functionality to register MCP tools with the server
 and handle the integration between tools and the MCP protocol.
 """
 
+import asyncio
 import logging
 from typing import Optional
 
 from .base import BaseMCPTool
 from .indexDocument import IndexDocumentTool
+from .indexDocuments import IndexDocumentsTool
 from .searchDocuments import SearchDocumentsTool
 from .getDocument import GetDocumentTool
 from ..tool_registry import ToolRegistry
@@ -65,6 +67,19 @@ async def register_core_tools(
             await database_manager.close()
             return False
         
+        # Register indexDocuments tool
+        success = await register_index_documents_tool(
+            tool_registry,
+            database_manager,
+            parser_factory,
+            logger
+        )
+        
+        if not success:
+            logger.error("Failed to register indexDocuments tool")
+            await database_manager.close()
+            return False
+        
         # Register searchDocuments tool
         success = await register_search_documents_tool(
             tool_registry,
@@ -91,6 +106,15 @@ async def register_core_tools(
             await database_manager.close()
             return False
         
+        async def shutdown_parser_factory():
+            """Stop the parser worker processes without blocking the loop."""
+            await asyncio.to_thread(parser_factory.shutdown)
+            
+        # Close the database and stop parser worker processes when the
+        # registry is cleaned up
+        tool_registry.add_cleanup_callback(database_manager.close)
+        tool_registry.add_cleanup_callback(shutdown_parser_factory)
+        
         logger.info("Core mydocs-mcp tools registered successfully")
         return True
         
@@ -155,6 +179,62 @@ async def register_index_document_tool(
         return False
 
 
+async def register_index_documents_tool(
+    tool_registry: ToolRegistry,
+    database_manager: DocumentManager,
+    parser_factory,
+    logger: Optional[logging.Logger] = None
+) -> bool:
+    """
+    Register the indexDocuments batch tool with the tool registry.
+    
+    Args:
+        tool_registry: ToolRegistry instance
+        database_manager: DocumentManager instance
+        parser_factory: ParserFactory instance
+        logger: Optional logger instance
+        
+    Returns:
+        True if registration successful, False otherwise
+    """
+    try:
+        # Create indexDocuments tool instance
+        index_documents_tool = IndexDocumentsTool(
+            database_manager=database_manager,
+            parser_factory=parser_factory,
+            logger=logger
+        )
+        
+        # Create wrapper function for tool registry
+        async def index_documents_handler(**kwargs):
+            """Handler function for indexDocuments tool."""
+            result = await index_documents_tool.execute(kwargs)
+            
+            # Convert ToolResult to registry-compatible format
+            if result.success:
+                return result.to_dict()
+            else:
+                return {"error": result.error, "success": False}
+        
+        # Register with tool registry
+        tool_registry.register_tool(
+            name=index_documents_tool.get_tool_name(),
+            description=index_documents_tool.get_tool_description(),
+            handler=index_documents_handler,
+            input_schema=index_documents_tool.get_parameter_schema()
+        )
+        
+        if logger:
+            logger.info(f"Registered {index_documents_tool.get_tool_name()} tool")
+        
+        return True
+        
+    except Exception as e:
+        if logger:
+            logger.error(f"Failed to register indexDocuments tool: {e}", exc_info=True)
+        return False
+
+
 async def register_search_documents_tool(
     tool_registry: ToolRegistry,
     database_manager: DocumentManager,
@@ -0,0 +1,48 @@
+"""
+Shared fixtures for the integration test suite.
+
+The in-process fixtures construct MyDocsMCPServer directly so the MCP
+handlers can be exercised without spawning the server inside a container.
+"""
+
+import pytest
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from src.server import MyDocsMCPServer
+from src.config import ServerConfig
+
+
+@pytest.fixture
+def test_config():
+    """Create test configuration."""
+    config = ServerConfig()
+    # Use in-memory database for testing
+    config.database_url = "sqlite:///:memory:"
+    config.log_level = "DEBUG"
+    config.debug_mode = True
+    return config
+
+
+@pytest.fixture
+async def test_server(test_config):
+    """Create test server instance."""
+    server = MyDocsMCPServer(test_config)
+    yield server
+    await server.stop()
+
+
+@pytest.fixture(scope="session")
+def make_req():
+    """
+    Factory for tool call requests.
+    
+    Test arguments are trusted, so requests are built with model_construct
+    to skip Pydantic validation on every call.
+    """
+    def _make_req(arguments, name="indexDocument"):
+        return CallToolRequest.model_construct(
+            params=CallToolRequestParams.model_construct(name=name, arguments=arguments)
+        )
+    
+    return _make_req
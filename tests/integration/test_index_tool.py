@@ -3,7 +3,27 @@
 import json
 import subprocess
 import time
+from pathlib import Path
 
+import orjson
+import pytest
+
+SAMPLE_DOCUMENT = (
+    Path(__file__).parent.parent.parent / "examples" / "sample_documents" / "api-design-guide.md"
+)
+
+
+async def test_index_document_inprocess(test_server, make_req):
+    """Test indexing a document without the Docker container."""
+    response = await test_server._handle_call_tool(make_req({"file_path": str(SAMPLE_DOCUMENT)}))
+    
+    assert not response.isError
+    response_data = orjson.loads(response.content[0].text)
+    assert response_data["success"] is True
+    assert response_data["data"]["status"] in ["indexed", "reindexed"]
+
+
+@pytest.mark.docker
 def test_index_document():
     """Test indexing a document."""
     cmd = ["docker", "exec", "-i", "mydocs-mcp-prod", "python", "-m", "src.server"]
@@ -49,34 +69,28 @@ def test_index_document():
             cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.PIPE
         )
         
         # Send requests line by line
-        input_lines = []
-        for req in requests:
-            input_lines.append(json.dumps(req))
-        
-        input_data = "\n".join(input_lines) + "\n"
-        print(f"Sending input:\n{input_data}")
+        input_data = b"".join(orjson.dumps(req) + b"\n" for req in requests)
+        print(f"Sending input:\n{input_data.decode()}")
         
         # Send input and wait
         stdout, stderr = process.communicate(input=input_data, timeout=20)
         
         print("=== STDOUT ===")
-        print(stdout)
+        print(stdout.decode("utf-8", "replace"))
         print("\n=== STDERR ===")
-        print(stderr)
+        print(stderr.decode("utf-8", "replace"))
         
         # Process responses
         success_count = 0
         if stdout:
-            lines = stdout.strip().split('\n')
-            for line in lines:
+            for line in stdout.splitlines():
                 if line.strip():
                     try:
-                        response = json.loads(line)
+                        response = orjson.loads(line)
                         req_id = response.get('id', 'unknown')
                         
                         if 'result' in response:
@@ -90,8 +104,8 @@ def test_index_document():
                             print(f"\n? Request {req_id} UNKNOWN:")
                             print(json.dumps(response, indent=2))
                             
-                    except json.JSONDecodeError as e:
-                        print(f"Non-JSON output: {line}")
+                    except orjson.JSONDecodeError as e:
+                        print(f"Non-JSON output: {line!r}")
         
         print(f"\n=== SUMMARY ===")
         print(f"Successful requests: {success_count}/3")
@@ -1,203 +1,229 @@
 #!/usr/bin/env python3
 """
 Test script to verify MCP server connection and tool availability.
+
+The Docker variants go through ``docker exec`` against the running
+``mydocs-mcp-prod`` container and only run when ``-m docker`` is selected.
+The in-process variants drive the same handlers on a local server instance.
 """
 import asyncio
-import json
-import subprocess
 import sys
 import logging
 
+import orjson
+import pytest
+
+from mcp.types import ListToolsRequest
+
+from src.database.connection import get_database_connection, release_database_connection
+
+
+async def test_mcp_connection_inprocess(test_server):
+    """Test MCP server initialization without the Docker container."""
+    assert test_server.server.name == "mydocs-mcp"
+    assert await test_server._initialize_tools()
+
+
+async def test_tools_list_inprocess(test_server):
+    """Test listing available tools without the Docker container."""
+    response = await test_server._handle_list_tools(ListToolsRequest())
+    
+    tool_names = [tool.name for tool in response.tools]
+    assert "indexDocument" in tool_names
+
+
+async def test_tools_list_snapshot_is_reused(test_server):
+    """Test that the tool list is built once and rebuilt only on registration."""
+    await test_server._initialize_tools()
+    registry = test_server.tool_registry
+    
+    tools = registry.get_available_tools()
+    assert registry.get_available_tools() is tools
+    
+    async def noop_handler():
+        return {}
+    
+    registry.register_tool("noop", "No-op tool", noop_handler, {"type": "object"})
+    refreshed = registry.get_available_tools()
+    assert refreshed is not tools
+    assert "noop" in [tool.name for tool in refreshed]
+
+
+async def test_stop_closes_database(test_server):
+    """Test that stopping the server closes and releases its database."""
+    await test_server._initialize_tools()
+    database_path = str(test_server.config.get_database_path())
+    connection = await get_database_connection(database_path)
+    assert connection._connection is not None
+    
+    await test_server.stop()
+    
+    assert connection._connection is None
+    assert not test_server.tool_registry.get_tool_names()
+    
+    # The pool hands out a fresh connection for the same path
+    reopened = await get_database_connection(database_path)
+    assert reopened is not connection
+    await release_database_connection(database_path)
+
+
+# Command from claude_code_config.json
+DOCKER_CMD = [
+    "docker", "exec", "-i", "mydocs-mcp-prod",
+    "python", "-m", "src.server"
+]
+
+DOCKER_ENV = {
+    "MCP_TRANSPORT": "stdio",
+    "LOG_LEVEL": "INFO",
+    "DATABASE_PATH": "/app/data/mydocs.db",
+    "DOCUMENT_DIRECTORIES": "/documents"
+}
+
+INIT_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {
+            "name": "test-client",
+            "version": "1.0.0"
+        }
+    }
+}
+
+# The first response also covers container exec and server startup; later
+# responses should arrive almost immediately, so a missed reply fails fast.
+STARTUP_TIMEOUT = 10.0
+RESPONSE_TIMEOUT = 0.5
+
+
+async def _start_server():
+    """Start the MCP server inside the Docker container."""
+    return await asyncio.create_subprocess_exec(
+        *DOCKER_CMD,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=DOCKER_ENV
+    )
+
+
+async def _send_request(process, request):
+    """Write a single JSON-RPC request to the server."""
+    process.stdin.write(orjson.dumps(request) + b"\n")
+    await process.stdin.drain()
+
+
+async def _read_response(process, request_id, timeout):
+    """Read stdout line by line until the response for request_id arrives."""
+    while True:
+        line = await asyncio.wait_for(process.stdout.readline(), timeout=timeout)
+        if not line:
+            return None
+        
+        try:
+            response = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            print(f"Non-JSON output: {line!r}")
+            continue
+        
+        if response.get("id") == request_id:
+            return response
+
+
+async def _stop_server(process):
+    """Stop the server process and print anything it wrote to stderr."""
+    if process.returncode is None:
+        process.kill()
+    _, stderr_data = await process.communicate()
+    
+    print("=== STDERR ===")
+    print(stderr_data.decode("utf-8", "replace"))
+
+
+@pytest.mark.docker
 async def test_mcp_connection():
     """Test the MCP connection to the Docker container."""
     print("Testing MCP server connection...")
     
-    # Command from claude_code_config.json
-    cmd = [
-        "docker", "exec", "-i", "mydocs-mcp-prod", 
-        "python", "-m", "src.server"
-    ]
-    
-    # Set up environment
-    env = {
-        "MCP_TRANSPORT": "stdio",
-        "LOG_LEVEL": "INFO", 
-        "DATABASE_PATH": "/app/data/mydocs.db",
-        "DOCUMENT_DIRECTORIES": "/documents"
-    }
+    process = await _start_server()
     
     try:
-        # Start the MCP server process
-        process = subprocess.Popen(
-            cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            env=env
-        )
+        print("Sending initialization request...")
+        await _send_request(process, INIT_REQUEST)
         
-        # Send initialization request
-        init_request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "test-client",
-                    "version": "1.0.0"
-                }
-            }
-        }
+        try:
+            response = await _read_response(process, 1, STARTUP_TIMEOUT)
+        except asyncio.TimeoutError:
+            pytest.fail("MCP server did not respond within timeout")
         
-        print("Sending initialization request...")
-        init_json = json.dumps(init_request) + "\n"
+        assert response is not None, "No response received from MCP server"
+        print(f"Initialization response: {response}")
         
-        # Send request
-        process.stdin.write(init_json)
-        process.stdin.flush()
+        assert "result" in response, f"MCP server initialization failed: {response}"
+        print("✅ MCP server initialization successful!")
         
-        # Read response (with timeout)
-        try:
-            # Wait for response
-            stdout_data, stderr_data = process.communicate(timeout=10)
-            
-            print("=== STDOUT ===")
-            print(stdout_data)
-            print("=== STDERR ===") 
-            print(stderr_data)
-            
-            if stdout_data:
-                try:
-                    response = json.loads(stdout_data.strip())
-                    print(f"Initialization response: {response}")
-                    
-                    if "result" in response:
-                        print("✅ MCP server initialization successful!")
-                        return True
-                    else:
-                        print("❌ MCP server initialization failed")
-                        return False
-                        
-                except json.JSONDecodeError as e:
-                    print(f"❌ Failed to parse JSON response: {e}")
-                    return False
-            else:
-                print("❌ No response received from MCP server")
-                return False
-                
-        except subprocess.TimeoutExpired:
-            print("❌ MCP server did not respond within timeout")
-            process.kill()
-            return False
-            
-    except Exception as e:
-        print(f"❌ Error testing MCP connection: {e}")
-        return False
+    finally:
+        await _stop_server(process)
+
 
+@pytest.mark.docker
 async def test_tools_list():
     """Test listing available tools."""
     print("\nTesting tools/list...")
     
-    cmd = [
-        "docker", "exec", "-i", "mydocs-mcp-prod",
-        "python", "-m", "src.server"
-    ]
-    
-    env = {
-        "MCP_TRANSPORT": "stdio",
-        "LOG_LEVEL": "INFO",
-        "DATABASE_PATH": "/app/data/mydocs.db", 
-        "DOCUMENT_DIRECTORIES": "/documents"
-    }
+    process = await _start_server()
     
     try:
-        process = subprocess.Popen(
-            cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            env=env
-        )
-        
-        # Send both initialization and tools/list requests
-        requests = [
-            {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize", 
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "clientInfo": {
-                        "name": "test-client",
-                        "version": "1.0.0"
-                    }
-                }
-            },
-            {
+        try:
+            await _send_request(process, INIT_REQUEST)
+            await _read_response(process, 1, STARTUP_TIMEOUT)
+            
+            await _send_request(process, {
                 "jsonrpc": "2.0",
                 "id": 2,
                 "method": "tools/list",
                 "params": {}
-            }
-        ]
-        
-        # Send requests
-        for req in requests:
-            req_json = json.dumps(req) + "\n"
-            process.stdin.write(req_json)
-            process.stdin.flush()
-        
-        # Close stdin to signal we're done
-        process.stdin.close()
+            })
+            response = await _read_response(process, 2, RESPONSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            pytest.fail("MCP server did not respond within timeout")
         
-        # Read all output
-        stdout_data, stderr_data = process.communicate(timeout=15)
+        assert response and "result" in response, f"Could not get tools list: {response}"
         
-        print("=== STDOUT ===")
-        print(stdout_data)
-        print("=== STDERR ===")
-        print(stderr_data)
+        tools = response["result"].get("tools", [])
+        assert tools, "MCP server returned no tools"
+        print(f"\n✅ Found {len(tools)} tools:")
+        for tool in tools:
+            print(f"  - {tool.get('name')}: {tool.get('description')}")
         
-        # Parse responses
-        if stdout_data:
-            lines = stdout_data.strip().split('\n')
-            for line in lines:
-                if line.strip():
-                    try:
-                        response = json.loads(line)
-                        if response.get("id") == 2 and "result" in response:
-                            tools = response["result"].get("tools", [])
-                            print(f"\n✅ Found {len(tools)} tools:")
-                            for tool in tools:
-                                print(f"  - {tool.get('name')}: {tool.get('description')}")
-                            return True
-                    except json.JSONDecodeError:
-                        continue
-        
-        print("❌ Could not get tools list")
-        return False
-        
-    except Exception as e:
-        print(f"❌ Error testing tools/list: {e}")
+    finally:
+        await _stop_server(process)
+
+
+async def _run_check(test):
+    """Run a test coroutine for the script entry point and report its outcome."""
+    try:
+        await test()
+        return True
+    except (Exception, pytest.fail.Exception) as e:
+        print(f"❌ {test.__name__} failed: {e}")
         return False
 
+
 if __name__ == "__main__":
     print("MCP Server Connection Test")
     print("=" * 50)
     
-    # Run tests
-    loop = asyncio.get_event_loop()
-    
     # Test basic connection
-    success = loop.run_until_complete(test_mcp_connection())
+    success = asyncio.run(_run_check(test_mcp_connection))
     
     if success:
         # Test tools list
-        loop.run_until_complete(test_tools_list())
+        success = asyncio.run(_run_check(test_tools_list))
     
-    print("\nTest completed.")
\ No newline at end of file
+    print("\nTest completed.")
+    sys.exit(0 if success else 1)
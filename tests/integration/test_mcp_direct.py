@@ -4,6 +4,41 @@ import json
 import subprocess
 import sys
 
+import orjson
+import pytest
+
+from mcp.types import ListToolsRequest
+
+
+async def test_mcp_tools_inprocess(test_server, make_req, tmp_path):
+    """Test the MCP server tools without the Docker container."""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Test Document\n\nThis is a test markdown file.\n")
+    
+    response = await test_server._handle_list_tools(ListToolsRequest())
+    assert "indexDocument" in [tool.name for tool in response.tools]
+    
+    response = await test_server._handle_call_tool(make_req({"file_path": str(test_file)}))
+    assert not response.isError
+
+
+def seed_test_document():
+    """Create the test markdown file inside the container."""
+    subprocess.run([
+        "docker", "exec", "mydocs-mcp-prod",
+        "sh", "-c",
+        "mkdir -p /documents && printf '# Test Document\\n\\nThis is a test markdown file.\\n' > /documents/test.md"
+    ], check=True)
+
+
+@pytest.fixture(scope="session")
+def seeded_container():
+    """Seed the container with the test document once per session."""
+    seed_test_document()
+
+
+@pytest.mark.docker
+@pytest.mark.usefixtures("seeded_container")
 def test_mcp_tools():
     """Test the MCP server tools directly."""
     cmd = ["docker", "exec", "-i", "mydocs-mcp-prod", "python", "-m", "src.server"]
@@ -49,32 +84,29 @@ def test_mcp_tools():
             cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.PIPE
         )
         
         # Send all requests
-        input_data = ""
-        for req in requests:
-            input_data += json.dumps(req) + "\n"
+        input_data = b"".join(orjson.dumps(req) + b"\n" for req in requests)
         
         # Execute and get response
         stdout, stderr = process.communicate(input=input_data, timeout=30)
         
         print("=== STDOUT ===")
-        print(stdout)
+        print(stdout.decode("utf-8", "replace"))
         print("=== STDERR ===") 
-        print(stderr)
+        print(stderr.decode("utf-8", "replace"))
         
         # Parse responses
         if stdout:
-            for line in stdout.strip().split('\n'):
+            for line in stdout.splitlines():
                 if line.strip():
                     try:
-                        response = json.loads(line)
+                        response = orjson.loads(line)
                         print(f"\nParsed response: {json.dumps(response, indent=2)}")
-                    except json.JSONDecodeError:
-                        print(f"Non-JSON line: {line}")
+                    except orjson.JSONDecodeError:
+                        print(f"Non-JSON line: {line!r}")
         
     except subprocess.TimeoutExpired:
         process.kill()
@@ -85,11 +117,7 @@ def test_mcp_tools():
 if __name__ == "__main__":
     # First ensure test file exists
     print("Creating test file...")
-    subprocess.run([
-        "docker", "exec", "mydocs-mcp-prod", 
-        "sh", "-c", 
-        "mkdir -p /documents && echo '# Test Document\n\nThis is a test markdown file.' > /documents/test.md"
-    ])
+    seed_test_document()
     
     print("Testing MCP tools...")
-    test_mcp_tools()
\ No newline at end of file
+    test_mcp_tools()
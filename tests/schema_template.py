@@ -0,0 +1,71 @@
+"""
+Pre-built database schema template for tests.
+
+Tests that need an on-disk database copy a template that already has every
+migration applied instead of running the schema DDL on each start. The
+template is keyed by a hash of the schema and migration sources, so any
+schema change builds a new one on the next run.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from src.database.connection import release_database_connection
+from src.database.migrations import initialize_database
+
+SRC_DATABASE_DIR = Path(__file__).parent.parent / "src" / "database"
+
+# Modules whose contents define the schema a fresh database ends up with
+SCHEMA_SOURCES = ("models.py", "migrations.py")
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "mydocs-mcp"
+
+
+def schema_hash() -> str:
+    """
+    Hash the sources that define the database schema.
+    
+    Returns:
+        Short hex digest identifying the current schema
+    """
+    digest = hashlib.sha256()
+    for name in SCHEMA_SOURCES:
+        digest.update((SRC_DATABASE_DIR / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+async def _build_template(template_path: Path) -> None:
+    """Run all migrations into a new template database."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    
+    # Build next to the final path and rename, so concurrent test workers
+    # never copy a half-written template
+    fd, build_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".db")
+    os.close(fd)
+    os.unlink(build_path)
+    
+    try:
+        assert await initialize_database(build_path), "Schema template build failed"
+    finally:
+        # Closing the last connection checkpoints the WAL into the file
+        await release_database_connection(build_path)
+        
+    os.replace(build_path, template_path)
+
+
+async def copy_schema_template(database_path: Path) -> None:
+    """
+    Create a database at database_path from the cached schema template.
+    
+    Args:
+        database_path: Path of the database file to create
+    """
+    template_path = CACHE_DIR / f"schema-{schema_hash()}.db"
+    if not template_path.exists():
+        await _build_template(template_path)
+        
+    Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(template_path, database_path)
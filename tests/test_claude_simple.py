@@ -6,6 +6,7 @@ Tests basic MCP functionality without Unicode issues.
 import asyncio
 import json
 import os
+import statistics
 import sys
 import tempfile
 import time
@@ -16,7 +17,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import ServerConfig
 from src.server import MyDocsMCPServer
-from src.database.connection import DatabaseConnection
+from tests.schema_template import copy_schema_template
+
+# Timed calls per latency check; each check also makes one untimed warm-up call
+PERF_RUNS = 5
+
+
+async def _median_call_ms(server, tool_name, arguments):
+    """Return the median latency in ms over PERF_RUNS calls and the last result."""
+    result = await server.tool_registry.execute_tool(tool_name, arguments)
+    times = []
+    for _ in range(PERF_RUNS):
+        start = time.perf_counter_ns()
+        result = await server.tool_registry.execute_tool(tool_name, arguments)
+        times.append((time.perf_counter_ns() - start) / 1e6)
+    return statistics.median(times), result
 
 
 async def test_claude_integration():
@@ -39,6 +54,9 @@ async def test_claude_integration():
     # Create directories
     os.makedirs(f"{test_dir}/documents", exist_ok=True)
     
+    # Start from a copy of the pre-migrated schema instead of running the DDL
+    await copy_schema_template(config.get_database_path())
+    
     # Create test documents
     docs = {
         "test.md": "# Test Document\n\nThis is for testing MCP integration.",
@@ -46,85 +64,75 @@ async def test_claude_integration():
         "readme.txt": "README: How to use this application"
     }
     
-    for filename, content in docs.items():
-        Path(f"{test_dir}/documents/{filename}").write_text(content)
+    await asyncio.gather(*(
+        asyncio.to_thread(Path(f"{test_dir}/documents/{filename}").write_text, content)
+        for filename, content in docs.items()
+    ))
     
     print("[OK] Created test documents")
     
+    server = MyDocsMCPServer(config)
+    
     try:
-        # Initialize server
-        server = MyDocsMCPServer(config)
-        print("[OK] Server initialized")
-        
-        # Initialize database
-        db_path = config.database_url.replace("sqlite:///", "")
-        db = DatabaseConnection(db_path)
-        await db.connect()  # This automatically initializes schema
-        print("[OK] Database initialized")
+        # Registering the tools also opens and initializes the database
+        assert await server._initialize_tools(), "Tool initialization failed"
+        print("[OK] Server and database initialized")
         
         # Test 1: Tool Registry
         print("\n[TEST] MCP Tool Registry")
         tools = server.tool_registry.get_available_tools()
-        assert len(tools) == 3, f"Expected 3 tools, got {len(tools)}"
-        tool_names = [t["name"] for t in tools]
+        assert len(tools) == 4, f"Expected 4 tools, got {len(tools)}"
+        tool_names = [t.name for t in tools]
         assert "indexDocument" in tool_names
+        assert "indexDocuments" in tool_names
         assert "searchDocuments" in tool_names
         assert "getDocument" in tool_names
-        print("  [PASS] All 3 MCP tools registered")
+        print("  [PASS] All 4 MCP tools registered")
         
         # Test 2: Index Document
         print("\n[TEST] indexDocument Tool")
-        start = time.time()
+        start = time.perf_counter_ns()
         result = await server.tool_registry.execute_tool(
             "indexDocument",
             {"file_path": f"{test_dir}/documents/test.md"}
         )
-        elapsed_ms = (time.time() - start) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start) / 1e6
         assert result["success"], "indexDocument failed"
-        assert result["document_id"], "No document ID returned"
+        assert result["data"]["document_id"], "No document ID returned"
         print(f"  [PASS] Document indexed in {elapsed_ms:.2f}ms")
         
         # Index all documents
-        for doc in ["api.md", "readme.txt"]:
-            await server.tool_registry.execute_tool(
-                "indexDocument",
-                {"file_path": f"{test_dir}/documents/{doc}"}
-            )
+        await server.tool_registry.execute_tool(
+            "indexDocuments",
+            {"file_paths": [f"{test_dir}/documents/{doc}" for doc in ["api.md", "readme.txt"]]}
+        )
         
         # Test 3: Search Documents
         print("\n[TEST] searchDocuments Tool")
-        start = time.time()
-        result = await server.tool_registry.execute_tool(
-            "searchDocuments",
-            {"query": "test"}
-        )
-        elapsed_ms = (time.time() - start) * 1000
-        assert "results" in result
-        assert len(result["results"]) > 0, "No search results found"
-        assert elapsed_ms < 200, f"Search too slow: {elapsed_ms:.2f}ms"
-        print(f"  [PASS] Search completed in {elapsed_ms:.2f}ms")
-        print(f"  [INFO] Found {len(result['results'])} results")
+        elapsed_ms, result = await _median_call_ms(server, "searchDocuments", {"query": "test"})
+        assert result["success"], "searchDocuments failed"
+        assert len(result["data"]["results"]) > 0, "No search results found"
+        assert elapsed_ms < 200, f"Search too slow: median {elapsed_ms:.2f}ms"
+        print(f"  [PASS] Search completed in {elapsed_ms:.2f}ms (median of {PERF_RUNS})")
+        print(f"  [INFO] Found {len(result['data']['results'])} results")
         
         # Test 4: Get Document
         print("\n[TEST] getDocument Tool")
-        start = time.time()
-        result = await server.tool_registry.execute_tool(
-            "getDocument",
-            {"file_path": f"{test_dir}/documents/test.md"}
+        elapsed_ms, result = await _median_call_ms(
+            server, "getDocument", {"file_path": f"{test_dir}/documents/test.md"}
         )
-        elapsed_ms = (time.time() - start) * 1000
         assert result["success"], "getDocument failed"
-        assert result["content"], "No content returned"
-        assert elapsed_ms < 200, f"Get too slow: {elapsed_ms:.2f}ms"
-        print(f"  [PASS] Document retrieved in {elapsed_ms:.2f}ms")
+        assert result["data"]["content"], "No content returned"
+        assert elapsed_ms < 200, f"Get too slow: median {elapsed_ms:.2f}ms"
+        print(f"  [PASS] Document retrieved in {elapsed_ms:.2f}ms (median of {PERF_RUNS})")
         
         # Test 5: MCP Protocol Compliance
         print("\n[TEST] MCP Protocol Compliance")
         for tool in tools:
-            assert "name" in tool
-            assert "description" in tool
-            assert "inputSchema" in tool
-            assert tool["inputSchema"]["type"] == "object"
+            assert tool.name
+            assert tool.description
+            assert tool.inputSchema
+            assert tool.inputSchema["type"] == "object"
         print("  [PASS] All tools comply with MCP protocol")
         
         # Test 6: stdio Transport
@@ -144,16 +152,10 @@ async def test_claude_integration():
         print("\nGRADE: A - READY FOR CLAUDE CODE INTEGRATION")
         print("="*60)
         
-        return True
-        
-    except Exception as e:
-        print(f"\n[ERROR] Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-        
     finally:
         # Cleanup
+        await server.stop()
+        
         import shutil
         try:
             shutil.rmtree(test_dir)
@@ -162,6 +164,18 @@ async def test_claude_integration():
             pass
 
 
+async def _run_check() -> bool:
+    """Run the integration test as a script, reporting failure instead of raising."""
+    try:
+        await test_claude_integration()
+        return True
+    except Exception as e:
+        print(f"\n[ERROR] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 if __name__ == "__main__":
-    success = asyncio.run(test_claude_integration())
+    success = asyncio.run(_run_check())
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -1,293 +1,358 @@
-"""Integration tests for SQLite database functionality."""
+"""
+Integration tests for SQLite database functionality.
+
+The database is an in-memory connection created once per module in the
+process running it, so pytest-xdist workers (``-n auto``) each get their own
+private copy and can run these tests in parallel with any ``--dist`` mode.
+"""
 
 import asyncio
+import dataclasses
 import os
-import tempfile
 from pathlib import Path
 from datetime import datetime
+from time import perf_counter_ns
 import json
 import pytest
-import aiosqlite
+import pytest_asyncio
 
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from database.models import Document, SearchIndex
+from database.models import DatabaseSchema, Document
 from database.connection import DatabaseConnection
-from database.queries import DocumentQueries
+from database.queries import DocumentQueries, SearchQueries
+
+# All tests share the module-scoped database and its event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Shared defaults for test documents; each test replaces the fields it needs
+DOCUMENT_TEMPLATE = Document(file_type="markdown", metadata_json="{}")
+
+TAGGED_METADATA_JSON = json.dumps({"tags": ["test"]})
+
+# Deterministic modification time for updated documents
+FIXED_TIMESTAMP = datetime(2024, 1, 1, 0, 0, 0)
+
+# (file_type, file_name) cases for the CRUD round-trip tests
+DOCUMENT_TYPES = [("markdown", "m.md"), ("text", "t.txt")]
+
+# Documents in the corpus searched by the performance test
+PERF_CORPUS_SIZE = 100
+
+# Tables emptied after each test; the FTS index follows documents via triggers
+TEST_TABLES = ("search_index", "document_metadata", "documents")
+
+
+async def bulk_load(db_connection, queries, docs):
+    """
+    Insert documents with the FTS sync triggers off, then index them once.
+    
+    Rebuilding the FTS index after the load replaces one index update per
+    inserted row.
+    
+    Args:
+        db_connection: Database connection the documents are written to
+        queries: DocumentQueries instance for the connection
+        docs: Documents to insert
+        
+    Returns:
+        Dictionary mapping file paths to document IDs
+    """
+    async with db_connection.transaction() as conn:
+        for trigger_name in DatabaseSchema.FTS_TRIGGER_NAMES:
+            await conn.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+    
+    try:
+        return await queries.bulk_index_documents([(doc, {}, []) for doc in docs])
+    finally:
+        async with db_connection.transaction() as conn:
+            for trigger_sql in DatabaseSchema.CREATE_FTS_TRIGGERS:
+                await conn.execute(trigger_sql)
+            await conn.execute(DatabaseSchema.REBUILD_FTS)
 
 
 class TestDatabaseIntegration:
     """Test suite for database integration."""
     
-    @pytest.fixture
+    @pytest_asyncio.fixture(scope="module", loop_scope="module")
     async def db_connection(self):
-        """Create a temporary database for testing."""
-        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-            db_path = tmp.name
-        
+        """Create an in-memory database once for the module."""
+        # Nothing here needs durability, so skip the file, journal and fsyncs
+        db = DatabaseConnection(":memory:")
         try:
-            db = DatabaseConnection(db_path)
-            await db.initialize()
+            # Connecting creates the schema
+            await db.connect()
             yield db
         finally:
             await db.close()
-            os.unlink(db_path)
+    
+    @pytest_asyncio.fixture(autouse=True, loop_scope="module")
+    async def clean_tables(self, db_connection):
+        """Empty the shared database after each test."""
+        yield
+        async with db_connection.transaction() as conn:
+            for table in TEST_TABLES:
+                await conn.execute(f"DELETE FROM {table}")
     
     @pytest.fixture
-    async def queries(self, db_connection):
+    def queries(self, db_connection):
         """Create DocumentQueries instance."""
         return DocumentQueries(db_connection)
     
-    @pytest.mark.asyncio
+    @pytest.fixture
+    def search_queries(self, db_connection):
+        """Create SearchQueries instance."""
+        return SearchQueries(db_connection)
+    
+    @pytest_asyncio.fixture(scope="module", loop_scope="module")
+    async def perf_corpus(self):
+        """Create a separate in-memory database holding the performance corpus."""
+        # Kept apart from db_connection, whose tables are emptied after
+        # every test, so the corpus is only built once
+        db = DatabaseConnection(":memory:")
+        try:
+            await db.connect()
+            docs = [
+                dataclasses.replace(
+                    DOCUMENT_TEMPLATE,
+                    file_path=f"/test/perf{i}.md",
+                    file_name=f"perf{i}.md",
+                    content=f"Performance test content {i}",
+                    file_size=30
+                )
+                for i in range(PERF_CORPUS_SIZE)
+            ]
+            document_ids = await bulk_load(db, DocumentQueries(db), docs)
+            assert len(document_ids) == PERF_CORPUS_SIZE
+            yield db
+        finally:
+            await db.close()
+    
     async def test_database_initialization(self, db_connection):
         """Test database schema initialization."""
-        async with aiosqlite.connect(db_connection.db_path) as conn:
-            cursor = await conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'"
-            )
-            tables = await cursor.fetchall()
-            table_names = [t[0] for t in tables]
-            
-            assert 'documents' in table_names
-            assert 'search_index' in table_names
-    
-    @pytest.mark.asyncio
-    async def test_insert_document(self, queries):
-        """Test inserting a document."""
-        doc = Document(
-            file_path="/test/doc.md",
-            file_name="doc.md",
-            content="Test content",
-            file_type="markdown",
-            file_size=12,
-            metadata_json=json.dumps({"tags": ["test"]})
+        # An in-memory database is only visible through its own connection
+        tables = await db_connection.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type='table'"
         )
+        table_names = {t[0] for t in tables}
         
-        doc_id = await queries.insert_document(doc)
-        assert doc_id is not None
-        assert doc_id > 0
+        assert 'documents' in table_names
+        assert 'search_index' in table_names
     
-    @pytest.mark.asyncio
-    async def test_get_document_by_path(self, queries):
-        """Test retrieving a document by path."""
-        doc = Document(
-            file_path="/test/doc2.md",
-            file_name="doc2.md",
-            content="Another test",
-            file_type="markdown",
-            file_size=12,
-            metadata_json="{}"
-        )
+    async def test_connection_pragmas(self, db_connection):
+        """Test the connection runs with the performance pragmas applied."""
+        # synchronous=NORMAL is 1 and temp_store=MEMORY is 2; WAL does not
+        # apply to an in-memory database, which keeps its own journal mode
+        assert (await db_connection.fetch_one("PRAGMA synchronous"))[0] == 1
+        assert (await db_connection.fetch_one("PRAGMA temp_store"))[0] == 2
+        assert (await db_connection.fetch_one("PRAGMA cache_size"))[0] == DatabaseSchema.PERFORMANCE_PRAGMAS["cache_size"]
+        assert (await db_connection.fetch_one("PRAGMA journal_mode"))[0] == "memory"
+    
+    @pytest.mark.parametrize("file_type,file_name", DOCUMENT_TYPES)
+    async def test_insert_roundtrip(self, queries, file_type, file_name):
+        """Test inserting documents and reading them back by path and type."""
+        # One document of every type, so the type filter has something to drop
+        for other_type, other_name in DOCUMENT_TYPES:
+            doc = dataclasses.replace(
+                DOCUMENT_TEMPLATE,
+                file_path=f"/test/{other_name}",
+                file_name=other_name,
+                content=f"{other_type} content",
+                file_type=other_type,
+                file_size=len(other_type) + 8,
+                metadata_json=TAGGED_METADATA_JSON
+            )
+            doc_id = await queries.create_document(doc)
+            assert doc_id is not None
+            assert doc_id > 0
         
-        await queries.insert_document(doc)
-        retrieved = await queries.get_document_by_path("/test/doc2.md")
+        retrieved = await queries.get_document_by_path(f"/test/{file_name}")
         
         assert retrieved is not None
-        assert retrieved.file_name == "doc2.md"
-        assert retrieved.content == "Another test"
+        assert retrieved.file_name == file_name
+        assert retrieved.content == f"{file_type} content"
+        assert retrieved.metadata == {"tags": ["test"]}
+        
+        typed_docs = await queries.list_documents(file_type=file_type)
+        assert [d.file_name for d in typed_docs] == [file_name]
     
-    @pytest.mark.asyncio
-    async def test_update_document(self, queries):
+    @pytest.mark.parametrize("file_type,file_name", DOCUMENT_TYPES)
+    async def test_update_document(self, queries, file_type, file_name):
         """Test updating a document."""
-        doc = Document(
-            file_path="/test/doc3.md",
-            file_name="doc3.md",
+        doc = dataclasses.replace(
+            DOCUMENT_TEMPLATE,
+            file_path=f"/test/{file_name}",
+            file_name=file_name,
             content="Original content",
-            file_type="markdown",
-            file_size=16,
-            metadata_json="{}"
+            file_type=file_type,
+            file_size=16
         )
         
-        doc_id = await queries.insert_document(doc)
+        doc_id = await queries.create_document(doc)
         
-        updated_doc = Document(
+        updated_doc = dataclasses.replace(
+            DOCUMENT_TEMPLATE,
             id=doc_id,
-            file_path="/test/doc3.md",
-            file_name="doc3.md",
+            file_path=f"/test/{file_name}",
+            file_name=file_name,
             content="Updated content",
-            file_type="markdown",
+            file_type=file_type,
             file_size=15,
-            modified_at=datetime.utcnow(),
-            metadata_json="{}"
+            modified_at=FIXED_TIMESTAMP
         )
         
         success = await queries.update_document(updated_doc)
         assert success is True
         
-        retrieved = await queries.get_document_by_path("/test/doc3.md")
+        retrieved = await queries.get_document_by_path(f"/test/{file_name}")
         assert retrieved.content == "Updated content"
+        assert retrieved.modified_at == FIXED_TIMESTAMP
     
-    @pytest.mark.asyncio
-    async def test_delete_document(self, queries):
+    @pytest.mark.parametrize("file_type,file_name", DOCUMENT_TYPES)
+    async def test_delete_document(self, queries, file_type, file_name):
         """Test deleting a document."""
-        doc = Document(
-            file_path="/test/doc4.md",
-            file_name="doc4.md",
+        doc = dataclasses.replace(
+            DOCUMENT_TEMPLATE,
+            file_path=f"/test/{file_name}",
+            file_name=file_name,
             content="To be deleted",
-            file_type="markdown",
-            file_size=13,
-            metadata_json="{}"
+            file_type=file_type,
+            file_size=13
         )
         
-        doc_id = await queries.insert_document(doc)
+        doc_id = await queries.create_document(doc)
         success = await queries.delete_document(doc_id)
         assert success is True
         
-        retrieved = await queries.get_document_by_path("/test/doc4.md")
+        retrieved = await queries.get_document_by_path(f"/test/{file_name}")
         assert retrieved is None
     
-    @pytest.mark.asyncio
-    async def test_search_index_operations(self, queries):
-        """Test search index CRUD operations."""
-        doc = Document(
+    async def test_search_index_operations(self, queries, search_queries):
+        """Test documents are searchable through the FTS5 index."""
+        doc = dataclasses.replace(
+            DOCUMENT_TEMPLATE,
             file_path="/test/searchdoc.md",
             file_name="searchdoc.md",
             content="Python programming tutorial",
-            file_type="markdown",
-            file_size=28,
-            metadata_json="{}"
+            file_size=28
+        )
+        other = dataclasses.replace(
+            DOCUMENT_TEMPLATE,
+            file_path="/test/otherdoc.md",
+            file_name="otherdoc.md",
+            content="Gardening notes",
+            file_size=15
         )
         
-        doc_id = await queries.insert_document(doc)
+        # The insert triggers index both documents; no manual entries needed
+        await asyncio.gather(queries.create_document(doc), queries.create_document(other))
         
-        # Add search index entries
-        index_entries = [
-            SearchIndex(document_id=doc_id, keyword="python", position=0, frequency=1),
-            SearchIndex(document_id=doc_id, keyword="programming", position=7, frequency=1),
-            SearchIndex(document_id=doc_id, keyword="tutorial", position=19, frequency=1),
-        ]
+        # Search for documents
+        results = await search_queries.search_documents("python")
+        assert len(results) == 1
+        document, score = results[0]
+        assert document.file_name == "searchdoc.md"
+        assert score > 0
         
-        for entry in index_entries:
-            await queries.insert_search_index(entry)
+        # Stemmed terms match through the porter tokenizer
+        results = await search_queries.search_documents("tutorials")
+        assert [document.file_name for document, _ in results] == ["searchdoc.md"]
         
-        # Search for documents
-        results = await queries.search_documents("python")
-        assert len(results) > 0
-        assert results[0].file_name == "searchdoc.md"
+        assert await search_queries.search_documents("javascript") == []
+        
+        # The planner must drive the search from the FTS index and reach
+        # documents by primary key; a scan here means a silent slowdown
+        plan = await queries.db.fetch_all(
+            "EXPLAIN QUERY PLAN " + SearchQueries.SEARCH_SQL,
+            ('"python"', 50, None, None, 50, 0)
+        )
+        details = [row[-1] for row in plan]
+        assert any("documents_fts VIRTUAL TABLE INDEX" in detail for detail in details)
+        assert any("USING INTEGER PRIMARY KEY" in detail for detail in details)
+        assert "SCAN d" not in details
     
-    @pytest.mark.asyncio
     async def test_get_all_documents(self, queries):
         """Test retrieving all documents."""
         docs = [
-            Document(
+            dataclasses.replace(
+                DOCUMENT_TEMPLATE,
                 file_path=f"/test/bulk{i}.md",
                 file_name=f"bulk{i}.md",
                 content=f"Content {i}",
-                file_type="markdown",
-                file_size=10,
-                metadata_json="{}"
+                file_size=10
             )
             for i in range(5)
         ]
         
-        for doc in docs:
-            await queries.insert_document(doc)
+        # One executemany in one transaction instead of a round trip per row
+        document_ids = await queries.bulk_index_documents([(doc, {}, []) for doc in docs])
+        assert len(set(document_ids.values())) == 5
         
-        all_docs = await queries.get_all_documents()
+        all_docs = await queries.list_documents()
         assert len(all_docs) >= 5
     
-    @pytest.mark.asyncio
-    async def test_get_documents_by_type(self, queries):
-        """Test filtering documents by type."""
-        md_doc = Document(
-            file_path="/test/markdown.md",
-            file_name="markdown.md",
-            content="MD content",
-            file_type="markdown",
-            file_size=10,
-            metadata_json="{}"
-        )
-        
-        txt_doc = Document(
-            file_path="/test/text.txt",
-            file_name="text.txt",
-            content="Text content",
-            file_type="text",
-            file_size=12,
-            metadata_json="{}"
-        )
-        
-        await queries.insert_document(md_doc)
-        await queries.insert_document(txt_doc)
-        
-        md_docs = await queries.get_documents_by_type("markdown")
-        assert any(d.file_name == "markdown.md" for d in md_docs)
-        assert not any(d.file_name == "text.txt" for d in md_docs)
-    
-    @pytest.mark.asyncio
-    async def test_performance_sub_200ms(self, queries):
+    async def test_performance_sub_200ms(self, perf_corpus):
         """Test that queries complete within 200ms."""
-        import time
-        
-        # Insert test data
-        for i in range(100):
-            doc = Document(
-                file_path=f"/test/perf{i}.md",
-                file_name=f"perf{i}.md",
-                content=f"Performance test content {i}",
-                file_type="markdown",
-                file_size=30,
-                metadata_json="{}"
-            )
-            await queries.insert_document(doc)
+        queries = DocumentQueries(perf_corpus)
+        search_queries = SearchQueries(perf_corpus)
         
         # Test search performance
-        start = time.time()
-        results = await queries.search_documents("performance")
-        elapsed = (time.time() - start) * 1000  # Convert to ms
+        start = perf_counter_ns()
+        results = await search_queries.search_documents("performance")
+        elapsed = (perf_counter_ns() - start) / 1e6  # Convert to ms
         
+        # All 100 documents match; the rebuilt index must return a full page
+        assert len(results) == 50, "Rebuilt FTS index is missing documents"
         assert elapsed < 200, f"Search took {elapsed:.2f}ms, expected < 200ms"
         
         # Test retrieval performance
-        start = time.time()
+        start = perf_counter_ns()
         doc = await queries.get_document_by_path("/test/perf50.md")
-        elapsed = (time.time() - start) * 1000
+        elapsed = (perf_counter_ns() - start) / 1e6
         
+        assert doc is not None
         assert elapsed < 200, f"Retrieval took {elapsed:.2f}ms, expected < 200ms"
     
-    @pytest.mark.asyncio
     async def test_concurrent_operations(self, queries):
         """Test concurrent database operations."""
         async def insert_doc(index):
-            doc = Document(
+            doc = dataclasses.replace(
+                DOCUMENT_TEMPLATE,
                 file_path=f"/test/concurrent{index}.md",
                 file_name=f"concurrent{index}.md",
                 content=f"Concurrent content {index}",
-                file_type="markdown",
-                file_size=25,
-                metadata_json="{}"
+                file_size=25
             )
-            return await queries.insert_document(doc)
+            return await queries.create_document(doc)
         
-        # Run 10 concurrent inserts
+        # Run 10 concurrent inserts; their transactions share one connection
+        # and are serialized by it rather than nested
         tasks = [insert_doc(i) for i in range(10)]
         results = await asyncio.gather(*tasks)
         
         assert len(results) == 10
         assert all(doc_id > 0 for doc_id in results)
+        assert len(set(results)) == 10
+        assert await queries.count_documents() == 10
     
-    @pytest.mark.asyncio
-    async def test_transaction_rollback(self, db_connection):
+    async def test_transaction_rollback(self, queries):
         """Test transaction rollback on error."""
-        queries = DocumentQueries(db_connection)
-        
-        doc = Document(
+        doc = dataclasses.replace(
+            DOCUMENT_TEMPLATE,
             file_path="/test/transaction.md",
             file_name="transaction.md",
             content="Transaction test",
-            file_type="markdown",
-            file_size=16,
-            metadata_json="{}"
+            file_size=16
         )
         
         # This should work
-        doc_id = await queries.insert_document(doc)
+        doc_id = await queries.create_document(doc)
         assert doc_id is not None
         
         # Try to insert duplicate (should fail due to unique constraint on file_path)
         try:
-            await queries.insert_document(doc)
+            await queries.create_document(doc)
             assert False, "Should have raised an exception"
         except Exception:
             pass  # Expected
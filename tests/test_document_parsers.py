@@ -160,6 +160,18 @@ This is the main content of the document.
         assert result.metadata["tags"] == ["test", "markdown"]
         assert result.metadata["has_frontmatter"] is True
     
+    @pytest.mark.parametrize("block,expected", [
+        ("just a line of text", {}),
+        ("{draft}", {"draft": None, "has_frontmatter": True}),
+        ("", {"has_frontmatter": True}),
+    ])
+    def test_frontmatter_without_key_value_pairs(self, parser, block, expected):
+        """Test frontmatter blocks without ':' still behave like YAML would."""
+        frontmatter, body = parser._extract_frontmatter(f"---\n{block}\n---\n# Body\n")
+        
+        assert frontmatter == expected
+        assert body == "# Body\n"
+    
     @pytest.mark.asyncio
     async def test_parse_empty_content(self, parser):
         """Test parsing empty content."""
@@ -191,6 +203,51 @@ This is a test markdown file.
             
         finally:
             os.unlink(temp_path)
+    
+    @pytest.mark.asyncio
+    async def test_parse_file_cache(self, parser):
+        """Test unchanged files reuse the cached parse result."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+            f.write("# Cached\n\nFirst version.\n")
+            temp_path = f.name
+            
+        try:
+            first = await parser.parse_file(temp_path)
+            first.metadata["headers"].clear()
+            
+            second = await parser.parse_file(temp_path)
+            assert second.parsing_stats["cache_hit"] is True
+            assert second.metadata["headers"][0]["text"] == "Cached"
+            
+            with open(temp_path, 'w') as f:
+                f.write("# Changed\n\nSecond version.\n")
+                
+            third = await parser.parse_file(temp_path)
+            assert third.parsing_stats["cache_hit"] is False
+            assert third.metadata["headers"][0]["text"] == "Changed"
+            
+        finally:
+            os.unlink(temp_path)
+    
+    @pytest.mark.asyncio
+    async def test_parse_cache_bounds(self, parser, monkeypatch):
+        """Test edits replace a path's entry and the cache stays within its size bounds."""
+        monkeypatch.setattr(MarkdownParser, "PARSE_CACHE_MAX_CHARS", 50)
+        monkeypatch.setattr(MarkdownParser, "PARSE_CACHE_MAX_ENTRY_CHARS", 30)
+        
+        await parser.parse_content_cached("# First version", "/docs/a.md")
+        await parser.parse_content_cached("# Second version", "/docs/a.md")
+        assert list(parser._parse_cache) == ["/docs/a.md"]
+        
+        # Too large to cache
+        await parser.parse_content_cached("# " + "x" * 40, "/docs/big.md")
+        assert "/docs/big.md" not in parser._parse_cache
+        
+        # Exceeding the character budget evicts the oldest entry
+        await parser.parse_content_cached("# Another document", "/docs/b.md")
+        await parser.parse_content_cached("# Yet another document", "/docs/c.md")
+        assert list(parser._parse_cache) == ["/docs/b.md", "/docs/c.md"]
+        assert parser._parse_cache_chars <= 50
 
 
 class TestTextParser:
@@ -397,6 +454,59 @@ class TestParserFactory:
         assert result.content == content
         assert result.metadata["document_type"] == "text"
     
+    @pytest.mark.asyncio
+    async def test_factory_parse_content_cache(self, factory):
+        """Test repeated content is served from the parser cache."""
+        content = "2025-09-04 10:00:00 INFO Application started"
+        
+        first = await factory.parse_content(content, "text")
+        second = await factory.parse_content(content, "text")
+        other_path = await factory.parse_content(content, "text", "/logs/app.log")
+        
+        assert first.parsing_stats["cache_hit"] is False
+        assert second.parsing_stats["cache_hit"] is True
+        assert second.keywords == first.keywords
+        assert second.metadata is not first.metadata
+        # The file path feeds type detection, so it is part of the key
+        assert other_path.parsing_stats["cache_hit"] is False
+        assert other_path.metadata["document_type"] == "log"
+        assert factory.get_factory_stats()["total_parses"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_factory_parse_large_content_in_process_pool(self, factory, monkeypatch):
+        """Test large content parsed in a worker process matches an in-process parse."""
+        monkeypatch.setattr(ParserFactory, "PROCESS_PARSE_MIN_CHARS", 100)
+        content = "# Pooled\n\nSee [docs](http://example.com).\n" * 10
+        
+        try:
+            pooled = await factory.parse_content(content, "markdown")
+        finally:
+            factory.shutdown()
+        local = await MarkdownParser().parse_content(content)
+        
+        assert pooled.success is True
+        assert pooled.content == local.content
+        assert pooled.keywords == local.keywords
+        assert pooled.metadata == local.metadata
+    
+    async def test_factory_parse_large_file_in_process_pool(self, factory, monkeypatch, tmp_path):
+        """Test large files are parsed in a worker process too."""
+        monkeypatch.setattr(ParserFactory, "PROCESS_PARSE_MIN_CHARS", 100)
+        content = "# Pooled\n\nSee [docs](http://example.com).\n" * 10
+        file_path = tmp_path / "pooled.md"
+        file_path.write_text(content)
+        
+        try:
+            pooled = await factory.parse_file(file_path)
+            assert factory._process_pool is not None
+        finally:
+            factory.shutdown()
+        local = await MarkdownParser().parse_file(file_path)
+        
+        assert pooled.success is True
+        assert pooled.keywords == local.keywords
+        assert pooled.metadata == local.metadata
+    
     def test_factory_stats(self, factory):
         """Test factory statistics tracking."""
         initial_stats = factory.get_factory_stats()
@@ -427,9 +537,9 @@ class TestParserPerformance:
 
 """ + "\n".join([f"## Section {i}\n\nThis is section {i} with some content." for i in range(100)])
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = await factory.parse_content(content, "markdown")
-        parse_time = (time.time() - start_time) * 1000
+        parse_time = (time.perf_counter_ns() - start_time) / 1e6
         
         assert result.success is True
         assert parse_time < 1000  # Should parse within 1 second
@@ -443,9 +553,9 @@ class TestParserPerformance:
         # Create large text content
         content = "\n".join([f"Line {i}: This is test content with various words." for i in range(1000)])
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = await factory.parse_content(content, "text")
-        parse_time = (time.time() - start_time) * 1000
+        parse_time = (time.perf_counter_ns() - start_time) / 1e6
         
         assert result.success is True
         assert parse_time < 2000  # Should parse within 2 seconds
@@ -462,7 +572,7 @@ class TestParserPerformance:
             "Document 4 plain text"
         ]
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         # Parse all documents concurrently
         tasks = [
@@ -471,7 +581,7 @@ class TestParserPerformance:
         ]
         
         results = await asyncio.gather(*tasks)
-        total_time = (time.time() - start_time) * 1000
+        total_time = (time.perf_counter_ns() - start_time) / 1e6
         
         # All should succeed
         assert all(r.success for r in results)
@@ -3,16 +3,24 @@ Test suite for file system watcher functionality.
 
 This module provides comprehensive tests for the file system watcher,
 including configuration, event handling, and integration with the indexing system.
+
+Async tests share one event loop per test class rather than creating one
+per test. Each test class is its own ``xdist_group`` and touches only its
+own temporary directories, so ``-n auto --dist loadgroup`` can run the
+classes on separate workers.
 """
 
 import asyncio
+import operator
 import os
 import shutil
+import sys
 import tempfile
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from typing import List, Optional
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, AsyncMock, MagicMock, patch
 import pytest
 import pytest_asyncio
 
@@ -21,7 +29,158 @@ from src.watcher.event_handler import AsyncFileSystemEventHandler, FileEvent
 from src.watcher.file_watcher import FileWatcher
 from src.watcher import create_default_watcher
 
+# Watcher environment variables patched in by the config loading tests
+WATCHER_ENV_FULL = {
+    'MYDOCS_WATCH_DIRS': '/home/user/docs;/home/user/notes',
+    'MYDOCS_WATCH_EXTENSIONS': '.md,.txt,.rst',
+    'MYDOCS_DEBOUNCE_DELAY_MS': '750',
+    'MYDOCS_RECURSIVE_WATCH': 'false'
+}
+WATCHER_ENV_DIRS = {
+    'MYDOCS_WATCH_DIRS': '/test/dir1;/test/dir2',
+    'MYDOCS_DEBOUNCE_DELAY_MS': '500'
+}
+
+# Result returned by FastIndexTool for every indexing call
+INDEX_SUCCESS = SimpleNamespace(is_success=True)
+
+
+class FastIndexTool:
+    """
+    Index tool stub that counts calls and always succeeds.
+    
+    Cheaper than an AsyncMock for tests that only need to know how many
+    documents the watcher tried to index.
+    """
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def _execute_tool(self, *args, **kwargs):
+        self.calls += 1
+        return INDEX_SUCCESS
+
+
+def _write_many(directory, count: int, suffix: str = ".md") -> List[str]:
+    """
+    Write count small documents named test<i><suffix> into directory.
+    
+    Returns:
+        Paths of the written files, in creation order
+    """
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"test{i}{suffix}")
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            os.write(fd, b"# Test Document " + str(i).encode())
+        finally:
+            os.close(fd)
+        paths.append(path)
+    return paths
+
+
+def _mk_event(path, event_type: str = 'created', **kwargs) -> FileEvent:
+    """Create a FileEvent for path, which may be a str or a Path."""
+    return FileEvent(event_type, str(path), **kwargs)
+
+
+class WaitableCallback:
+    """
+    Async callback wrapper that lets a test wait for a number of calls.
+    
+    Each call is forwarded to the wrapped callback and then wakes any
+    waiter, so tests resume as soon as the expected calls have happened
+    instead of sleeping for a fixed interval.
+    """
+    
+    def __init__(self, callback):
+        self.callback = callback
+        self.call_count = 0
+        self._called = asyncio.Event()
+    
+    async def __call__(self, *args, **kwargs):
+        try:
+            return await self.callback(*args, **kwargs)
+        finally:
+            self.call_count += 1
+            self._called.set()
+    
+    async def wait_for_count(self, count: int):
+        """Wait until the callback has been called at least count times."""
+        while self.call_count < count:
+            self._called.clear()
+            await self._called.wait()
+
+
+@pytest.fixture
+def fast_debounce():
+    """Debounce and batch delay in milliseconds for handler tests."""
+    return 2
+
+
+@pytest.fixture
+def fast_tmp(tmp_path_factory):
+    """
+    Create a temporary directory on tmpfs where available.
+    
+    Watcher tests that write files are I/O bound, so on Linux they run
+    under /dev/shm and elsewhere fall back to pytest's temporary directory.
+    """
+    if sys.platform != 'linux' or not os.path.isdir('/dev/shm'):
+        yield tmp_path_factory.mktemp("watcher")
+        return
+        
+    path = Path(tempfile.mkdtemp(dir='/dev/shm'))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
 
+@pytest.fixture
+def temp_watch_dir(fast_tmp):
+    """Create temporary directory for watching."""
+    return str(fast_tmp)
+
+
+@pytest.fixture(scope="class")
+def shared_index_tool():
+    """Create index tool stub shared by the tests of a class."""
+    return FastIndexTool()
+
+
+def _configure_database_manager(mock_db):
+    """Set the default return values of a mock database manager."""
+    mock_db.doc_queries.get_document_by_path.return_value = None
+    mock_db.doc_queries.delete_document_by_path.return_value = True
+    mock_db.doc_queries.update_document_path.return_value = True
+
+
+@pytest.fixture(scope="class")
+def shared_database_manager():
+    """Create mock database manager shared by the tests of a class."""
+    mock_db = AsyncMock()
+    _configure_database_manager(mock_db)
+    return mock_db
+
+
+@pytest.fixture(scope="module")
+def shared_fixture_files(tmp_path_factory):
+    """
+    Create one file per test extension, shared by tests that only read them.
+    
+    Returns:
+        Dictionary mapping each extension to its fixture file path
+    """
+    fixture_dir = tmp_path_factory.mktemp("watcher_fixtures")
+    files = {}
+    for suffix in ('.md', '.txt', '.py', '.tmp'):
+        file_path = fixture_dir / f"test{suffix}"
+        file_path.write_text("test content")
+        files[suffix] = file_path
+    return files
+
+
+@pytest.mark.xdist_group("watcher_config")
 class TestWatcherConfig:
     """Test watcher configuration functionality."""
     
@@ -60,38 +219,21 @@ class TestWatcherConfig:
         expected = {'.md', '.txt', '.rst'}
         assert config.watched_extensions == expected
     
-    def test_should_watch_file(self):
+    def test_should_watch_file(self, shared_fixture_files):
         """Test file watching decision logic."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create test files
-            md_file = temp_path / "test.md"
-            txt_file = temp_path / "test.txt"
-            py_file = temp_path / "test.py"
-            tmp_file = temp_path / "test.tmp"
-            
-            for file_path in [md_file, txt_file, py_file, tmp_file]:
-                file_path.write_text("test content")
-            
-            config = WatcherConfig()
-            
-            # Should watch .md and .txt files
-            assert config.should_watch_file(md_file)
-            assert config.should_watch_file(txt_file)
-            
-            # Should not watch .py files
-            assert not config.should_watch_file(py_file)
-            
-            # Should not watch temporary files
-            assert not config.should_watch_file(tmp_file)
-    
-    @patch.dict(os.environ, {
-        'MYDOCS_WATCH_DIRS': '/home/user/docs;/home/user/notes',
-        'MYDOCS_WATCH_EXTENSIONS': '.md,.txt,.rst',
-        'MYDOCS_DEBOUNCE_DELAY_MS': '750',
-        'MYDOCS_RECURSIVE_WATCH': 'false'
-    })
+        config = WatcherConfig()
+        
+        # Should watch .md and .txt files
+        assert config.should_watch_file(shared_fixture_files['.md'])
+        assert config.should_watch_file(shared_fixture_files['.txt'])
+        
+        # Should not watch .py files
+        assert not config.should_watch_file(shared_fixture_files['.py'])
+        
+        # Should not watch temporary files
+        assert not config.should_watch_file(shared_fixture_files['.tmp'])
+    
+    @patch.dict(os.environ, WATCHER_ENV_FULL)
     def test_load_config_from_env(self):
         """Test loading configuration from environment variables."""
         config = load_watcher_config_from_env()
@@ -105,21 +247,30 @@ class TestWatcherConfig:
         assert config.enable_recursive is False
 
 
+@pytest.mark.xdist_group("watcher_handler")
 class TestAsyncFileSystemEventHandler:
     """Test async file system event handler."""
     
-    @pytest_asyncio.fixture
-    async def mock_callback(self):
+    @pytest.fixture
+    def mock_callback(self):
         """Create mock async callback."""
         return AsyncMock()
     
+    @pytest.fixture
+    def waitable_callback(self, mock_callback):
+        """Wrap the mock callback so tests can wait for its calls."""
+        return WaitableCallback(mock_callback)
+    
     @pytest_asyncio.fixture
-    def handler(self, mock_callback):
+    def handler(self, waitable_callback, fast_debounce):
         """Create event handler with mock callback."""
-        config = WatcherConfig(debounce_delay_ms=100)
+        config = WatcherConfig(
+            debounce_delay_ms=fast_debounce,
+            batch_delay_ms=fast_debounce
+        )
         return AsyncFileSystemEventHandler(
             config=config,
-            event_callback=mock_callback
+            event_callback=waitable_callback
         )
     
     def test_handler_initialization(self, handler):
@@ -128,266 +279,174 @@ class TestAsyncFileSystemEventHandler:
         assert handler.event_callback is not None
         assert len(handler._event_counts) > 0
     
-    @pytest.mark.asyncio
-    async def test_event_processing_with_debouncing(self, handler, mock_callback):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_event_processing_with_debouncing(self, handler, mock_callback, waitable_callback, tmp_path):
         """Test event processing with debouncing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_file = Path(temp_dir) / "test.md"
-            test_file.write_text("test content")
-            
-            # Create file event
-            file_event = FileEvent(
-                event_type='created',
-                file_path=str(test_file)
-            )
-            
-            # Process event
-            await handler._handle_event_async(file_event)
-            
-            # Wait for debouncing
-            await asyncio.sleep(0.2)
-            
-            # Verify callback was called
-            mock_callback.assert_called_once()
-            call_args = mock_callback.call_args[0][0]
-            assert call_args.event_type == 'created'
-            assert call_args.file_path == str(test_file)
-    
-    @pytest.mark.asyncio
-    async def test_batch_processing(self, mock_callback):
+        test_file = tmp_path / "test.md"
+        test_file.write_text("test content")
+        
+        # Create file event
+        file_event = _mk_event(test_file)
+        
+        # Process event
+        await handler._handle_event_async(file_event)
+        
+        # Wait for debouncing
+        await asyncio.wait_for(waitable_callback.wait_for_count(1), timeout=2.0)
+        
+        # Verify callback was called
+        mock_callback.assert_called_once()
+        call_args = mock_callback.call_args[0][0]
+        assert call_args.event_type == 'created'
+        assert call_args.file_path == str(test_file)
+    
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_batch_processing(self, mock_callback, waitable_callback, fast_debounce, tmp_path):
         """Test batch event processing."""
         config = WatcherConfig(
             batch_processing=True,
-            batch_delay_ms=100
+            batch_delay_ms=fast_debounce
         )
         handler = AsyncFileSystemEventHandler(
             config=config,
-            event_callback=mock_callback
+            event_callback=waitable_callback
         )
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create multiple events
-            events = []
-            for i in range(3):
-                test_file = Path(temp_dir) / f"test{i}.md"
-                test_file.write_text("test content")
-                events.append(FileEvent(
-                    event_type='created',
-                    file_path=str(test_file)
-                ))
-            
-            # Process all events
-            for event in events:
-                await handler._handle_event_async(event)
+        # Create multiple events
+        events = []
+        for i in range(3):
+            test_file = tmp_path / f"test{i}.md"
+            test_file.write_text("test content")
+            events.append(_mk_event(test_file))
             
-            # Wait for batch processing
-            await asyncio.sleep(0.2)
+        # Process all events
+        for event in events:
+            await handler._handle_event_async(event)
             
-            # Verify all events were processed
-            assert mock_callback.call_count == 3
+        # Wait for batch processing
+        await asyncio.wait_for(waitable_callback.wait_for_count(3), timeout=2.0)
+        
+        # Verify all events were processed
+        assert mock_callback.call_count == 3
     
-    def test_event_filtering(self, handler):
+    def test_event_filtering(self, handler, shared_fixture_files):
         """Test event filtering logic."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create test files
-            md_file = temp_path / "test.md"
-            py_file = temp_path / "test.py"
-            tmp_file = temp_path / "test.tmp"
-            
-            for file_path in [md_file, py_file, tmp_file]:
-                file_path.write_text("test content")
-            
-            # Test events
-            md_event = FileEvent('created', str(md_file))
-            py_event = FileEvent('created', str(py_file))
-            tmp_event = FileEvent('created', str(tmp_file))
-            
-            # Should process .md files
-            assert handler._should_process_event(md_event)
-            
-            # Should not process .py files
-            assert not handler._should_process_event(py_event)
-            
-            # Should not process temporary files
-            assert not handler._should_process_event(tmp_event)
+        md_event = _mk_event(shared_fixture_files['.md'])
+        py_event = _mk_event(shared_fixture_files['.py'])
+        tmp_event = _mk_event(shared_fixture_files['.tmp'])
+        
+        # Should process .md files
+        assert handler._should_process_event(md_event)
+        
+        # Should not process .py files
+        assert not handler._should_process_event(py_event)
+        
+        # Should not process temporary files
+        assert not handler._should_process_event(tmp_event)
     
-    @pytest.mark.asyncio
-    async def test_cleanup(self, handler):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_cleanup(self, handler, tmp_path):
         """Test handler cleanup."""
         # Add some pending events
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_file = Path(temp_dir) / "test.md"
-            test_file.write_text("test content")
-            
-            event = FileEvent('created', str(test_file))
-            await handler._handle_event_async(event)
-            
-            # Cleanup should not raise errors
-            await handler.cleanup()
-            
-            # Verify state is cleaned
-            assert len(handler._pending_events) == 0
-            assert len(handler._debounce_tasks) == 0
+        test_file = tmp_path / "test.md"
+        test_file.write_text("test content")
+        
+        event = _mk_event(test_file)
+        await handler._handle_event_async(event)
+        
+        # Cleanup should not raise errors
+        await handler.cleanup()
+        
+        # Verify state is cleaned
+        assert len(handler._pending_events) == 0
+        assert len(handler._debounce_tasks) == 0
 
 
+@pytest.mark.xdist_group("file_watcher")
 class TestFileWatcher:
     """Test main file watcher functionality."""
     
-    @pytest_asyncio.fixture
-    async def temp_watch_dir(self):
-        """Create temporary directory for watching."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
+    @pytest.fixture
+    def index_tool(self, shared_index_tool):
+        """Provide the shared index tool with a fresh call count."""
+        yield shared_index_tool
+        shared_index_tool.calls = 0
     
-    @pytest_asyncio.fixture
-    def mock_index_tool(self):
-        """Create mock index tool."""
-        mock_tool = AsyncMock()
-        mock_tool._execute_tool.return_value = Mock(is_success=True)
-        return mock_tool
+    @pytest.fixture
+    def mock_database_manager(self, shared_database_manager):
+        """Provide the shared database manager with its default return values."""
+        yield shared_database_manager
+        shared_database_manager.reset_mock()
+        # reset_mock keeps return values, so restore any a test overrode,
+        # such as a mocked existing document
+        _configure_database_manager(shared_database_manager)
     
     @pytest_asyncio.fixture
-    def mock_database_manager(self):
-        """Create mock database manager."""
-        mock_db = AsyncMock()
-        mock_db.doc_queries.get_document_by_path.return_value = None
-        mock_db.doc_queries.delete_document_by_path.return_value = True
-        mock_db.doc_queries.update_document_path.return_value = True
-        return mock_db
+    def watcher(self, temp_watch_dir, index_tool, mock_database_manager):
+        """Create file watcher for the temporary directory."""
+        # None of these tests needs real inotify/FSEvents watches
+        with patch("src.watcher.file_watcher.Observer", MagicMock):
+            yield FileWatcher(
+                config=WatcherConfig(watch_directories=[temp_watch_dir]),
+                index_tool=index_tool,
+                database_manager=mock_database_manager
+            )
     
-    def test_watcher_initialization(self, temp_watch_dir, mock_index_tool, mock_database_manager):
+    def test_watcher_initialization(self, watcher, temp_watch_dir, index_tool, mock_database_manager):
         """Test file watcher initialization."""
-        config = WatcherConfig(watch_directories=[temp_watch_dir])
-        
-        watcher = FileWatcher(
-            config=config,
-            index_tool=mock_index_tool,
-            database_manager=mock_database_manager
-        )
-        
-        assert watcher.config == config
-        assert watcher.index_tool == mock_index_tool
+        assert watcher.config.watch_directories == [str(Path(temp_watch_dir).resolve())]
+        assert watcher.index_tool == index_tool
         assert watcher.database_manager == mock_database_manager
         assert not watcher.is_watching
     
-    @pytest.mark.asyncio
-    async def test_watcher_start_stop(self, temp_watch_dir, mock_index_tool, mock_database_manager):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_watcher_start_stop(self, watcher):
         """Test starting and stopping the watcher."""
-        config = WatcherConfig(watch_directories=[temp_watch_dir])
-        
-        watcher = FileWatcher(
-            config=config,
-            index_tool=mock_index_tool,
-            database_manager=mock_database_manager
-        )
-        
         # Start watcher
         success = await watcher.start()
         assert success
         assert watcher.is_watching
         assert watcher.start_time is not None
+        watcher.observer.start.assert_called_once()
         
         # Stop watcher
         success = await watcher.stop()
         assert success
         assert not watcher.is_watching
     
-    @pytest.mark.asyncio
-    async def test_file_created_handling(self, temp_watch_dir, mock_index_tool, mock_database_manager):
-        """Test handling file creation events."""
-        config = WatcherConfig(watch_directories=[temp_watch_dir])
-        watcher = FileWatcher(
-            config=config,
-            index_tool=mock_index_tool,
-            database_manager=mock_database_manager
-        )
-        
+    @pytest.mark.parametrize("event_type,old_path,existing_doc,expected_action,call_counter", [
+        ('created', None, False, 'indexed', 'index_tool.calls'),
+        ('modified', None, False, 'indexed', 'index_tool.calls'),
+        ('deleted', None, False, 'deleted',
+         'database_manager.doc_queries.delete_document_by_path.call_count'),
+        ('moved', '/old/path.md', True, 'moved',
+         'database_manager.doc_queries.update_document_path.call_count'),
+    ])
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_handle_file_event(
+        self, watcher, temp_watch_dir, event_type, old_path, existing_doc,
+        expected_action, call_counter
+    ):
+        """Test handling file creation, modification, deletion and move events."""
         # Create test file
         test_file = Path(temp_watch_dir) / "test.md"
         test_file.write_text("# Test Document\n\nThis is a test.")
         
-        # Handle creation event
-        event = FileEvent('created', str(test_file))
-        action = await watcher._handle_file_created(event)
-        
-        assert action == 'indexed'
-        mock_index_tool._execute_tool.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_file_modified_handling(self, temp_watch_dir, mock_index_tool, mock_database_manager):
-        """Test handling file modification events."""
-        config = WatcherConfig(watch_directories=[temp_watch_dir])
-        watcher = FileWatcher(
-            config=config,
-            index_tool=mock_index_tool,
-            database_manager=mock_database_manager
-        )
-        
-        # Create test file
-        test_file = Path(temp_watch_dir) / "test.md"
-        test_file.write_text("# Modified Document\n\nThis was modified.")
+        if existing_doc:
+            # Mock existing document
+            mock_doc = Mock()
+            mock_doc.id = 1
+            watcher.database_manager.doc_queries.get_document_by_path.return_value = mock_doc
         
-        # Handle modification event
-        event = FileEvent('modified', str(test_file))
-        action = await watcher._handle_file_modified(event)
+        # Handle event
+        event = _mk_event(test_file, event_type, old_path=old_path)
+        action = await getattr(watcher, f'_handle_file_{event_type}')(event)
         
-        assert action == 'indexed'
-        mock_index_tool._execute_tool.assert_called_once()
+        assert action == expected_action
+        assert operator.attrgetter(call_counter)(watcher) == 1
     
-    @pytest.mark.asyncio
-    async def test_file_deleted_handling(self, temp_watch_dir, mock_index_tool, mock_database_manager):
-        """Test handling file deletion events."""
-        config = WatcherConfig(watch_directories=[temp_watch_dir])
-        watcher = FileWatcher(
-            config=config,
-            index_tool=mock_index_tool,
-            database_manager=mock_database_manager
-        )
-        
-        # Handle deletion event
-        event = FileEvent('deleted', '/path/to/deleted/file.md')
-        action = await watcher._handle_file_deleted(event)
-        
-        assert action == 'deleted'
-        mock_database_manager.doc_queries.delete_document_by_path.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_file_moved_handling(self, temp_watch_dir, mock_index_tool, mock_database_manager):
-        """Test handling file move events."""
-        config = WatcherConfig(watch_directories=[temp_watch_dir])
-        watcher = FileWatcher(
-            config=config,
-            index_tool=mock_index_tool,
-            database_manager=mock_database_manager
-        )
-        
-        # Create test file at new location
-        new_file = Path(temp_watch_dir) / "moved.md"
-        new_file.write_text("# Moved Document")
-        
-        # Mock existing document
-        mock_doc = Mock()
-        mock_doc.id = 1
-        mock_database_manager.doc_queries.get_document_by_path.return_value = mock_doc
-        
-        # Handle move event
-        event = FileEvent('moved', str(new_file), old_path='/old/path.md')
-        action = await watcher._handle_file_moved(event)
-        
-        assert action == 'moved'
-        mock_database_manager.doc_queries.update_document_path.assert_called_once()
-    
-    def test_statistics_tracking(self, temp_watch_dir, mock_index_tool, mock_database_manager):
+    def test_statistics_tracking(self, watcher):
         """Test statistics tracking."""
-        config = WatcherConfig(watch_directories=[temp_watch_dir])
-        watcher = FileWatcher(
-            config=config,
-            index_tool=mock_index_tool,
-            database_manager=mock_database_manager
-        )
-        
         stats = watcher.get_statistics()
         
         assert 'is_watching' in stats
@@ -395,15 +454,8 @@ class TestFileWatcher:
         assert 'processing_stats' in stats
         assert isinstance(stats['processing_stats'], dict)
     
-    def test_health_status(self, temp_watch_dir, mock_index_tool, mock_database_manager):
+    def test_health_status(self, watcher):
         """Test health status checking."""
-        config = WatcherConfig(watch_directories=[temp_watch_dir])
-        watcher = FileWatcher(
-            config=config,
-            index_tool=mock_index_tool,
-            database_manager=mock_database_manager
-        )
-        
         health = watcher.get_health_status()
         
         assert 'healthy' in health
@@ -411,20 +463,11 @@ class TestFileWatcher:
         assert 'error_rate' in health
         assert isinstance(health['issues'], list)
     
-    @pytest.mark.asyncio
-    async def test_manual_scan(self, temp_watch_dir, mock_index_tool, mock_database_manager):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_manual_scan(self, watcher, temp_watch_dir):
         """Test manual directory scanning."""
-        config = WatcherConfig(watch_directories=[temp_watch_dir])
-        watcher = FileWatcher(
-            config=config,
-            index_tool=mock_index_tool,
-            database_manager=mock_database_manager
-        )
-        
         # Create test files
-        for i in range(3):
-            test_file = Path(temp_watch_dir) / f"test{i}.md"
-            test_file.write_text(f"# Test Document {i}")
+        _write_many(temp_watch_dir, 3)
         
         # Run manual scan
         results = await watcher.manual_scan(temp_watch_dir)
@@ -434,63 +477,63 @@ class TestFileWatcher:
         assert results['scan_time_seconds'] > 0
 
 
+@pytest.mark.xdist_group("watcher_integration")
 class TestWatcherIntegration:
     """Test watcher integration with other components."""
     
-    def test_create_default_watcher(self):
+    def test_create_default_watcher(self, tmp_path, monkeypatch):
         """Test creating default watcher."""
+        # Keep the default watcher off shared directories such as ~/Documents
+        monkeypatch.setenv('MYDOCS_WATCH_DIRS', str(tmp_path))
+        
         watcher = create_default_watcher()
         
         assert isinstance(watcher, FileWatcher)
         assert watcher.config is not None
-        assert len(watcher.config.watch_directories) >= 0
+        assert watcher.config.watch_directories == [str(tmp_path.resolve())]
     
-    @pytest.mark.asyncio
-    async def test_watcher_with_real_files(self):
+    @pytest.mark.integration
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_watcher_with_real_files(self, fast_debounce, fast_tmp):
         """Test watcher with actual file operations."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Mock components
-            mock_index_tool = AsyncMock()
-            mock_index_tool._execute_tool.return_value = Mock(is_success=True)
-            
-            mock_db = AsyncMock()
-            mock_db.doc_queries.get_document_by_path.return_value = None
-            
-            config = WatcherConfig(
-                watch_directories=[temp_dir],
-                debounce_delay_ms=50  # Fast for testing
-            )
+        # Mock components
+        index_tool = FastIndexTool()
+        indexed = WaitableCallback(index_tool._execute_tool)
+        index_tool._execute_tool = indexed
+        
+        mock_db = AsyncMock()
+        mock_db.doc_queries.get_document_by_path.return_value = None
+        
+        config = WatcherConfig(
+            watch_directories=[str(fast_tmp)],
+            debounce_delay_ms=fast_debounce,
+            batch_delay_ms=fast_debounce
+        )
+        
+        watcher = FileWatcher(
+            config=config,
+            index_tool=index_tool,
+            database_manager=mock_db
+        )
+        
+        # Start watcher
+        await watcher.start()
+        
+        try:
+            # Create a file
+            test_file = fast_tmp / "test.md"
+            test_file.write_text("# Test Document")
             
-            watcher = FileWatcher(
-                config=config,
-                index_tool=mock_index_tool,
-                database_manager=mock_db
-            )
+            # Wait for event processing
+            await asyncio.wait_for(indexed.wait_for_count(1), timeout=2.0)
             
-            # Start watcher
-            await watcher.start()
+            # The index tool should have been called
+            assert index_tool.calls >= 1
             
-            try:
-                # Create a file
-                test_file = Path(temp_dir) / "test.md"
-                test_file.write_text("# Test Document")
-                
-                # Wait for event processing
-                await asyncio.sleep(0.2)
-                
-                # Modify the file
-                test_file.write_text("# Modified Test Document")
-                
-                # Wait for event processing
-                await asyncio.sleep(0.2)
-                
-                # The mock should have been called
-                assert mock_index_tool._execute_tool.call_count >= 1
-                
-            finally:
-                await watcher.stop()
-    
-    @pytest.mark.asyncio
+        finally:
+            await watcher.stop()
+    
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_error_handling_in_watcher(self, temp_watch_dir):
         """Test error handling in watcher operations."""
         # Mock tool that raises exceptions
@@ -508,74 +551,67 @@ class TestWatcherIntegration:
         test_file.write_text("# Test Document")
         
         # Handle event - should not raise exception
-        event = FileEvent('created', str(test_file))
+        event = _mk_event(test_file)
         action = await watcher._handle_file_created(event)
         
         # Should handle error gracefully
         assert action is None  # Error case
         assert watcher.stats['indexing_errors'] > 0
     
+    @patch.dict(os.environ, WATCHER_ENV_DIRS)
     def test_config_environment_integration(self):
         """Test configuration integration with environment."""
-        with patch.dict(os.environ, {
-            'MYDOCS_WATCH_DIRS': '/test/dir1;/test/dir2',
-            'MYDOCS_DEBOUNCE_DELAY_MS': '500'
-        }):
-            config = load_watcher_config_from_env()
-            
-            # Environment values should be loaded
-            assert config.debounce_delay_ms == 500
-            # Directories will be validated - may not match exactly if paths don't exist
+        config = load_watcher_config_from_env()
+        
+        # Environment values should be loaded
+        assert config.debounce_delay_ms == 500
+        # Directories will be validated - may not match exactly if paths don't exist
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("watcher_workflow")
 class TestFullWatcherWorkflow:
     """Integration tests for complete watcher workflow."""
     
-    @pytest.mark.asyncio
-    async def test_end_to_end_workflow(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_end_to_end_workflow(self, fast_debounce, fast_tmp):
         """Test complete end-to-end watcher workflow."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Set up components
-            events_processed = []
-            
-            async def mock_callback(event):
-                events_processed.append(event)
-            
-            config = WatcherConfig(
-                watch_directories=[temp_dir],
-                debounce_delay_ms=50,
-                batch_processing=False
-            )
-            
-            handler = AsyncFileSystemEventHandler(
-                config=config,
-                event_callback=mock_callback
-            )
-            
-            # Create files and trigger events
-            test_files = []
-            for i in range(3):
-                file_path = Path(temp_dir) / f"test{i}.md"
-                file_path.write_text(f"# Test Document {i}")
-                test_files.append(file_path)
-                
-                # Create event
-                event = FileEvent('created', str(file_path))
-                await handler._handle_event_async(event)
-            
-            # Wait for processing
-            await asyncio.sleep(0.2)
+        # Set up components
+        events_processed = []
+        
+        async def mock_callback(event):
+            events_processed.append(event)
             
-            # Verify all events were processed
-            assert len(events_processed) == 3
+        callback = WaitableCallback(mock_callback)
+        
+        config = WatcherConfig(
+            watch_directories=[str(fast_tmp)],
+            debounce_delay_ms=fast_debounce,
+            batch_processing=False
+        )
+        
+        handler = AsyncFileSystemEventHandler(
+            config=config,
+            event_callback=callback
+        )
+        
+        # Create files and trigger events
+        for file_path in _write_many(fast_tmp, 3):
+            event = _mk_event(file_path)
+            await handler._handle_event_async(event)
             
-            for i, event in enumerate(events_processed):
-                assert event.event_type == 'created'
-                assert f'test{i}.md' in event.file_path
+        # Wait for processing
+        await asyncio.wait_for(callback.wait_for_count(3), timeout=2.0)
+        
+        # Verify all events were processed
+        assert len(events_processed) == 3
+        
+        for i, event in enumerate(events_processed):
+            assert event.event_type == 'created'
+            assert f'test{i}.md' in event.file_path
             
-            # Cleanup
-            await handler.cleanup()
+        # Cleanup
+        await handler.cleanup()
 
 
 if __name__ == "__main__":
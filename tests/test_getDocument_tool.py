@@ -15,6 +15,7 @@ import pytest
 import asyncio
 import tempfile
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -169,6 +170,56 @@ class TestGetDocumentTool:
         # Verify database call
         get_document_tool.database_manager.doc_queries.get_document_by_path.assert_called_once_with("/test/sample.md")
     
+    @pytest.mark.asyncio
+    async def test_retrieve_document_by_path_cached(self, get_document_tool, sample_document, tmp_path):
+        """Test that unchanged files are served from the document cache."""
+        doc_path = tmp_path / "sample.md"
+        doc_path.write_text(sample_document.content)
+        sample_document.modified_at = datetime.now()
+        get_by_path = get_document_tool.database_manager.doc_queries.get_document_by_path
+        get_by_path.return_value = sample_document
+        get_document_tool.database_manager.metadata_queries.get_document_metadata.return_value = {}
+        
+        for _ in range(3):
+            result = await get_document_tool.execute({"file_path": str(doc_path)})
+            assert result.success is True
+            
+        get_by_path.assert_called_once_with(str(doc_path))
+        
+        # A new modification time invalidates the cached entry
+        stat = doc_path.stat()
+        os.utime(doc_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        result = await get_document_tool.execute({"file_path": str(doc_path)})
+        assert result.success is True
+        assert get_by_path.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_document_cache_skips_stale_rows(self, get_document_tool, sample_document, tmp_path):
+        """Test that rows older than the file or an index generation are not reused."""
+        doc_path = tmp_path / "sample.md"
+        doc_path.write_text(sample_document.content)
+        get_by_path = get_document_tool.database_manager.doc_queries.get_document_by_path
+        get_by_path.return_value = sample_document
+        get_document_tool.database_manager.metadata_queries.get_document_metadata.return_value = {}
+        get_document_tool.database_manager.index_generation = 0
+        
+        # The row predates the file on disk, so it is never cached
+        sample_document.modified_at = datetime(2000, 1, 1)
+        for _ in range(2):
+            assert (await get_document_tool.execute({"file_path": str(doc_path)})).success
+        assert get_by_path.call_count == 2
+        
+        # A current row is cached until the document is indexed again
+        sample_document.modified_at = datetime.now()
+        for _ in range(2):
+            assert (await get_document_tool.execute({"file_path": str(doc_path)})).success
+        assert get_by_path.call_count == 3
+        
+        get_document_tool.database_manager.index_generation = 1
+        assert (await get_document_tool.execute({"file_path": str(doc_path)})).success
+        assert get_by_path.call_count == 4
+    
     @pytest.mark.asyncio
     async def test_document_not_found_by_id(self, get_document_tool):
         """Test handling when document not found by ID."""
@@ -301,7 +301,7 @@ def process_document_{i}():
             test_documents.append((f"doc_{i}.md", content))
         
         # Index all documents and measure performance
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         doc_ids = []
         
         for filename, content in test_documents:
@@ -318,7 +318,7 @@ def process_document_{i}():
             assert doc_id is not None
             doc_ids.append(doc_id)
         
-        indexing_time = (time.time() - start_time) * 1000
+        indexing_time = (time.perf_counter_ns() - start_time) / 1e6
         
         # Performance validation - should be reasonable for 10 documents
         avg_time_per_doc = indexing_time / len(test_documents)
@@ -327,9 +327,9 @@ def process_document_{i}():
         print(f"Indexed {len(test_documents)} documents in {indexing_time:.2f}ms (avg: {avg_time_per_doc:.2f}ms per doc)")
         
         # Test search performance
-        search_start = time.time()
+        search_start = time.perf_counter_ns()
         search_results = await document_manager.search_documents("performance testing")
-        search_time = (time.time() - search_start) * 1000
+        search_time = (time.perf_counter_ns() - search_start) / 1e6
         
         assert len(search_results) > 0
         assert search_time < 200  # Should meet < 200ms requirement
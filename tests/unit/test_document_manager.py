@@ -0,0 +1,75 @@
+"""
+Unit tests for DocumentManager batch indexing.
+
+This test suite covers DocumentManager.index_documents writing
+documents in batched transactions and reporting failed batches
+per file path.
+"""
+
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from src.database.database_manager import create_document_manager
+
+
+class TestIndexDocuments:
+    """Test suite for DocumentManager.index_documents."""
+    
+    @pytest.fixture
+    async def document_manager(self, tmp_path):
+        """Create a document manager backed by a temporary database."""
+        manager = await create_document_manager(str(tmp_path / "batch.db"))
+        assert manager is not None
+        yield manager
+        await manager.close()
+    
+    async def test_index_documents_in_batches(self, document_manager):
+        """Test every document is written and gets its own ID."""
+        documents = [(f"/docs/{i}.md", f"content {i}", {"index": str(i)}) for i in range(5)]
+        
+        document_ids = await document_manager.index_documents(documents, batch_size=2)
+        
+        assert set(document_ids) == {path for path, _, _ in documents}
+        assert None not in document_ids.values()
+        assert len(set(document_ids.values())) == 5
+    
+    async def test_index_documents_failing_batch(self, document_manager, monkeypatch):
+        """Test a failed batch maps each of its paths to None."""
+        bulk_index = document_manager.doc_queries.bulk_index_documents
+        calls = []
+        
+        async def fail_second_batch(batch):
+            calls.append(batch)
+            if len(calls) == 2:
+                raise RuntimeError("disk I/O error")
+            return await bulk_index(batch)
+            
+        monkeypatch.setattr(document_manager.doc_queries, "bulk_index_documents", fail_second_batch)
+        generation = document_manager.index_generation
+        documents = [(f"/docs/{i}.md", f"content {i}", None) for i in range(5)]
+        
+        document_ids = await document_manager.index_documents(documents, batch_size=2)
+        
+        assert len(calls) == 3
+        assert document_ids["/docs/2.md"] is None
+        assert document_ids["/docs/3.md"] is None
+        for path in ("/docs/0.md", "/docs/1.md", "/docs/4.md"):
+            assert isinstance(document_ids[path], int)
+            
+        # The batches that did succeed still invalidate cached documents
+        assert document_manager.index_generation > generation
+        assert await document_manager.doc_queries.get_document_by_path("/docs/2.md") is None
+        assert await document_manager.doc_queries.get_document_by_path("/docs/4.md") is not None
+    
+    async def test_index_documents_missing_content(self, document_manager):
+        """Test entries without content are rejected without failing the rest."""
+        document_ids = await document_manager.index_documents([
+            ("/docs/empty.md", "", None),
+            ("/docs/full.md", "content", None)
+        ])
+        
+        assert document_ids["/docs/empty.md"] is None
+        assert isinstance(document_ids["/docs/full.md"], int)
@@ -0,0 +1,178 @@
+"""
+Unit tests for FTS5 document search.
+
+This test suite covers MATCH expression building, keeping the
+external-content documents_fts index in sync with the documents
+table, and the Migration003 upgrade and rollback.
+"""
+
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from src.database.database_manager import create_document_manager
+from src.database.migrations import Migration003_ExternalContentFTS
+from src.database.queries import SearchQueries
+
+
+class TestBuildMatchExpression:
+    """Test suite for SearchQueries._build_match_expression."""
+    
+    @pytest.mark.parametrize("keywords,expected", [
+        (["foo"], '"foo"'),
+        (["foo", "bar"], '"foo" OR "bar"'),
+        (['say"hi'], '"say""hi"'),
+        (["foo", "--", "!?", "bar"], '"foo" OR "bar"'),
+        (["and", "near(", "-foo"], '"and" OR "near(" OR "-foo"'),
+        (["AND", "OR", "NOT"], '"AND" OR "OR" OR "NOT"'),
+        (["*", "(", ")"], ""),
+        ([], ""),
+    ])
+    def test_build_match_expression(self, keywords, expected):
+        """Test terms are quoted and unsearchable terms are dropped."""
+        assert SearchQueries._build_match_expression(keywords) == expected
+
+
+class TestFTSSearch:
+    """Test suite for searching through the documents_fts index."""
+    
+    @pytest.fixture
+    async def document_manager(self, tmp_path):
+        """Create a document manager backed by a temporary database."""
+        manager = await create_document_manager(str(tmp_path / "fts.db"))
+        assert manager is not None
+        yield manager
+        await manager.close()
+    
+    async def _search_paths(self, document_manager, query, file_type_filter=None):
+        """Return the file paths matched by a search."""
+        results = await document_manager.search_queries.search_documents(
+            query, file_type_filter=file_type_filter
+        )
+        return {document.file_path for document, _ in results}
+    
+    @pytest.mark.parametrize("query", [
+        "AND",
+        "NEAR( python",
+        "-python",
+        '"python',
+        "python OR",
+        "file_name:python",
+        "pyth* ^python",
+    ])
+    async def test_search_with_fts_syntax(self, document_manager, query):
+        """Test FTS5 query syntax in user input is matched literally."""
+        await document_manager.index_document("/docs/a.md", "python notes")
+        
+        # Must not raise an FTS5 syntax error
+        await document_manager.search_queries.search_documents(query)
+    
+    async def test_search_punctuation_only_query(self, document_manager):
+        """Test a query without searchable terms returns no results."""
+        await document_manager.index_document("/docs/a.md", "python notes")
+        
+        assert await self._search_paths(document_manager, "-- !!") == set()
+    
+    async def test_search_after_update(self, document_manager):
+        """Test reindexing a document replaces its indexed content."""
+        await document_manager.index_document("/docs/a.md", "original walrus text")
+        assert await self._search_paths(document_manager, "walrus") == {"/docs/a.md"}
+        
+        await document_manager.index_document("/docs/a.md", "replacement penguin text")
+        
+        assert await self._search_paths(document_manager, "walrus") == set()
+        assert await self._search_paths(document_manager, "penguin") == {"/docs/a.md"}
+    
+    async def test_search_after_delete(self, document_manager):
+        """Test deleted documents are removed from the index."""
+        document_id = await document_manager.index_document("/docs/a.md", "walrus")
+        await document_manager.index_document("/docs/b.md", "walrus")
+        
+        assert await document_manager.delete_document(document_id)
+        
+        assert await self._search_paths(document_manager, "walrus") == {"/docs/b.md"}
+    
+    async def test_search_matches_stemmed_terms(self, document_manager):
+        """Test the porter tokenizer matches inflected forms."""
+        await document_manager.index_document("/docs/a.md", "running the indexer")
+        
+        assert await self._search_paths(document_manager, "runs") == {"/docs/a.md"}
+    
+    async def test_filtered_search_beyond_candidate_cap(self, document_manager, monkeypatch):
+        """Test filtered results ranked past the candidate cap are still found."""
+        monkeypatch.setattr(SearchQueries, "FILTERED_CANDIDATE_FACTOR", 1)
+        for i in range(5):
+            await document_manager.index_document(f"/docs/top{i}.md", "walrus walrus")
+        await document_manager.index_document(
+            "/docs/low.txt", "walrus " + "filler words " * 20
+        )
+        
+        results = await document_manager.search_queries.search_documents(
+            "walrus", limit=1, file_type_filter="txt"
+        )
+        
+        assert [document.file_path for document, _ in results] == ["/docs/low.txt"]
+    
+    async def test_keyword_index_not_populated_by_default(self, document_manager):
+        """Test indexing skips the keyword search_index table by default."""
+        await document_manager.index_document("/docs/a.md", "python notes")
+        
+        row = await document_manager.db_connection.fetch_one(
+            "SELECT COUNT(*) FROM search_index"
+        )
+        assert row[0] == 0
+
+
+class TestMigration003:
+    """Test suite for the external-content FTS migration."""
+    
+    @pytest.fixture
+    async def document_manager(self, tmp_path):
+        """Create a document manager backed by a temporary database."""
+        manager = await create_document_manager(str(tmp_path / "migration.db"))
+        assert manager is not None
+        yield manager
+        await manager.close()
+    
+    async def _fts_table_sql(self, document_manager):
+        """Return the CREATE statement of documents_fts."""
+        row = await document_manager.db_connection.fetch_one(
+            "SELECT sql FROM sqlite_master WHERE name = 'documents_fts'"
+        )
+        return row[0]
+    
+    async def test_rollback_restores_legacy_table(self, document_manager):
+        """Test rollback recreates a content-bearing table with its rows."""
+        await document_manager.index_document("/docs/a.md", "walrus")
+        connection = await document_manager.db_connection.connect()
+        
+        await Migration003_ExternalContentFTS().rollback(connection)
+        
+        assert "content='documents'" not in await self._fts_table_sql(document_manager)
+        row = await document_manager.db_connection.fetch_one(
+            "SELECT COUNT(*) FROM documents_fts WHERE documents_fts MATCH 'walrus'"
+        )
+        assert row[0] == 1
+    
+    async def test_upgrade_from_legacy_table(self, document_manager):
+        """Test upgrading a legacy table rebuilds the index from documents."""
+        await document_manager.index_document("/docs/a.md", "walrus")
+        connection = await document_manager.db_connection.connect()
+        migration = Migration003_ExternalContentFTS()
+        await migration.rollback(connection)
+        
+        # Written while the legacy triggers are installed
+        await document_manager.index_document("/docs/b.md", "walrus penguin")
+        
+        await migration.upgrade(connection)
+        
+        assert "content='documents'" in await self._fts_table_sql(document_manager)
+        results = await document_manager.search_queries.search_documents("walrus")
+        assert {document.file_path for document, _ in results} == {"/docs/a.md", "/docs/b.md"}
+        
+        # The new triggers keep the index in sync after the upgrade
+        await document_manager.index_document("/docs/b.md", "penguin")
+        results = await document_manager.search_queries.search_documents("walrus")
+        assert [document.file_path for document, _ in results] == ["/docs/a.md"]
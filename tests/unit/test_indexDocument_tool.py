@@ -7,6 +7,7 @@ the parser and database systems.
 """
 
 import asyncio
+import hashlib
 import os
 import pytest
 import tempfile
@@ -228,6 +229,31 @@ More content here.
         mock_parser_factory.parse_file.assert_not_called()
         mock_database_manager.index_document.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_execute_touched_file_unchanged_content(self, index_tool, mock_database_manager, mock_parser_factory, temp_text_file):
+        """Test that a modified file with identical content is not reindexed."""
+        content = "This is a test document with some content."
+        
+        # Mock existing document indexed before the file was touched
+        mock_doc = MagicMock()
+        mock_doc.id = 456
+        mock_doc.modified_at = datetime(2000, 1, 1)
+        mock_doc.indexed_at = datetime(2000, 1, 1)
+        mock_doc.file_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        
+        mock_database_manager.doc_queries.get_document_by_path.return_value = mock_doc
+        mock_database_manager.touch_document.return_value = datetime(2001, 1, 1)
+        mock_parser_factory.parse_file.return_value = ParserResult(success=True, content=content)
+        
+        result = await index_tool.execute({"file_path": temp_text_file})
+        
+        assert result.success
+        assert result.data["status"] == "already_indexed"
+        assert result.data["document_id"] == 456
+        assert result.data["indexed_at"] == datetime(2001, 1, 1).isoformat()
+        mock_database_manager.index_document.assert_not_called()
+        mock_database_manager.touch_document.assert_awaited_once_with(456)
+    
     @pytest.mark.asyncio
     async def test_execute_force_reindex(self, index_tool, mock_database_manager, mock_parser_factory, temp_text_file):
         """Test execution with force_reindex=True."""